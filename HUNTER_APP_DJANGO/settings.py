@@ -56,6 +56,56 @@ DATABASES = {
     }
 }
 
+# 파일 캐시 저장 위치 (고객 거래 데이터가 pickle 평문으로 기록됨)
+# - 기본값은 프로젝트 외부 사용자 캐시 디렉터리, STR_DASHBOARD_CACHE_DIR 환경변수로 변경 가능
+# - Django FileBasedCache는 디렉터리를 0o700, 파일을 0o600(mkstemp)으로 생성하므로
+#   서버 실행 계정만 읽을 수 있음 (상위 디렉터리도 다른 계정이 접근할 수 없는 위치 사용)
+# - 보관 기간: 항목별 TIMEOUT 경과 후 조회/정리 시 삭제, MAX_ENTRIES 초과 시 일부 삭제
+CACHE_DIR = Path(os.environ.get(
+    'STR_DASHBOARD_CACHE_DIR',
+    Path.home() / '.cache' / 'str_dashboard'
+))
+
+# 캐시 설정
+# - default: 세션 외 임시 데이터 보관 (DB 연결 정보(암호화 저장), 화면 상태, 조회 요약 등 소용량)
+#   모든 워커가 같은 데이터를 보도록 DB 캐시 사용 (테이블은 str_dashboard 마이그레이션이 생성)
+# - results: 통합 조회 결과/TOML 보관 (파일 캐시 - 워커 간 공유, 워커 메모리 점유 방지)
+# - orderbook: Stage 4 Redshift Orderbook 조회 결과 보관 (파일 캐시 - 워커 메모리 점유 방지)
+# results/orderbook은 서버(호스트)별 파일 캐시이므로 여러 서버로 운영하려면
+# 세 캐시 모두 BACKEND를 'django.core.cache.backends.redis.RedisCache'로,
+# LOCATION을 'redis://<host>:6379/<db>'로 교체해야 함 (default만 바꾸면 대용량 슬롯은 공유되지 않음)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'str_dashboard_cache',
+        'TIMEOUT': 3600,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+    'results': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_DIR / 'results',
+        # 사용자별 최근 조회 결과(압축)를 보관하므로 수명만 세션 데이터와 동일하게 제한
+        'TIMEOUT': 3600,
+        'OPTIONS': {
+            'MAX_ENTRIES': 200,
+            'CULL_FREQUENCY': 4,
+        },
+    },
+    'orderbook': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_DIR / 'orderbook',
+        # 항목당 Orderbook 전체 결과를 보관하므로 개수와 수명을 제한
+        # (가득 차면 임의 항목 1/CULL_FREQUENCY 만큼 제거, 만료 항목은 조회 시 삭제)
+        'TIMEOUT': 3600,
+        'OPTIONS': {
+            'MAX_ENTRIES': 32,
+            'CULL_FREQUENCY': 4,
+        },
+    },
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator','OPTIONS': {'min_length': 8}},
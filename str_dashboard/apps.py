@@ -1,6 +1,48 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
 
+# JVM 선기동 활성화 환경변수 ('1'일 때만 ready()에서 기동)
+WARM_JVM_ENV = 'STR_DASHBOARD_WARM_JVM'
+
+
 class StrDashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'str_dashboard'
+
+    def ready(self):
+        # JVM 선기동은 명시적으로 켠 경우에만 수행 (테스트/관리 명령에서는 JVM을 띄우지 않음)
+        if os.environ.get(WARM_JVM_ENV) != '1':
+            return
+        if not self._is_serving_process():
+            return
+
+        from .utils.db import OracleConnection
+        OracleConnection.warm_jvm()
+
+    @staticmethod
+    def _is_serving_process() -> bool:
+        """
+        요청을 처리할 프로세스인지 확인
+
+        - manage.py: runserver 실제 서버 프로세스만 (자동 재시작 감시 프로세스 제외, --noreload 포함)
+        - gunicorn: ready()가 마스터에서 실행될 수 있으므로(--preload) 제외.
+          fork 이후 각 워커에서 기동하도록 gunicorn 설정의 post_fork 훅 사용:
+              def post_fork(server, worker):
+                  from str_dashboard.utils.db import OracleConnection
+                  OracleConnection.warm_jvm()
+        - 그 외 WSGI 서버: 워커 프로세스에서 앱이 로드되므로 기동
+        """
+        program = os.path.basename(sys.argv[0]) if sys.argv else ''
+
+        if program in ('manage.py', 'django-admin'):
+            if len(sys.argv) < 2 or sys.argv[1] != 'runserver':
+                return False
+            return '--noreload' in sys.argv or os.environ.get('RUN_MAIN') == 'true'
+
+        if 'gunicorn' in program:
+            return False
+
+        return True
@@ -0,0 +1,21 @@
+# str_dashboard/migrations/0001_create_cache_table.py
+"""
+default 캐시(DatabaseCache) 테이블 생성
+migrate만으로 워커 간 공유 캐시를 사용할 수 있도록 createcachetable 실행 (이미 있으면 생략됨)
+"""
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = []
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
@@ -5,7 +5,7 @@ TOML 데이터 수집 및 조합 로직
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import pandas as pd  # <--- 수정된 부분: pandas import 추가
 
 from .toml_config import toml_config
@@ -24,18 +24,25 @@ class TomlDataCollector:
         self.config = toml_config
         self.processor = toml_processor
 
-    def collect_all_data(self, df_manager_data: Dict[str, Any]) -> Dict[str, Any]:
-        """세션 데이터를 수집하여 TOML 형식으로 변환"""
+    def collect_all_data(self, df_manager_data: Union[DataFrameManager, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        세션 데이터를 수집하여 TOML 형식으로 변환
+        이미 복원된 DataFrameManager를 받으면 재복원하지 않음 (읽기 전용으로 사용)
+        """
         
         logger.info("Starting TOML data collection...")
         collected_data = {}
         
-        df_manager = DataFrameManager.from_dict(df_manager_data)
+        if isinstance(df_manager_data, DataFrameManager):
+            df_manager = df_manager_data
+        else:
+            df_manager = DataFrameManager.from_dict(df_manager_data)
         
-        customer_df = df_manager.get_dataframe('customer_info')
-        if customer_df is not None and not customer_df.empty:
+        # 고객 정보는 단일 행이므로 행 딕셔너리로 조회
+        customer_row = df_manager.get_row_dict('customer_info')
+        if customer_row is not None:
             logger.info("Processing customer data...")
-            collected_data = self._process_customer_data(customer_df, df_manager.metadata)
+            collected_data = self._process_customer_data(customer_row, df_manager.metadata)
             
             dup_df = df_manager.get_dataframe('duplicate_persons')
             if dup_df is not None and not dup_df.empty:
@@ -47,17 +54,16 @@ class TomlDataCollector:
         logger.info(f"Data collection completed. Sections: {list(collected_data.keys())}")
         return collected_data
 
-    def _process_customer_data(self, customer_df: pd.DataFrame, metadata: Dict) -> Dict[str, Any]:
-        """고객 데이터 처리"""
-        if customer_df.empty:
+    def _process_customer_data(self, customer_row: Dict[str, Any], metadata: Dict) -> Dict[str, Any]:
+        """고객 데이터 처리 (고객 정보 첫 행 딕셔너리)"""
+        if not customer_row:
             return {"혐의대상자_고객_정보": {}}
 
-        row = customer_df.iloc[0]
         cust_id = metadata.get('cust_id')
         mid = metadata.get('mid')
         
         processed = {}
-        for col, value in row.items():
+        for col, value in customer_row.items():
             if pd.isna(value) or value == '':
                 continue
             
@@ -9,11 +9,32 @@ from datetime import datetime
 from typing import Dict, Any
 from pathlib import Path
 
+try:
+    # Rust 기반 직렬화 (설치된 경우 우선 사용)
+    import rtoml
+except ImportError:
+    rtoml = None
+
 from .toml_collector import toml_collector
 
 logger = logging.getLogger(__name__)
 
 
+def dumps_toml(data: Dict[str, Any]) -> str:
+    """
+    TOML 문자열 생성
+    rtoml이 있으면 사용하고, 없으면 toml 패키지로 처리
+    rtoml이 직렬화하지 못하는 값(Decimal, numpy 스칼라 등)이 있으면 toml 패키지로 재시도
+    (None 값은 두 방식 모두 출력에서 제외)
+    """
+    if rtoml is not None:
+        try:
+            return rtoml.dumps(data, none_value=None)
+        except rtoml.TomlSerializationError as e:
+            logger.debug(f"rtoml serialization failed, falling back to toml: {e}")
+    return toml.dumps(data)
+
+
 class TomlExporter:
     """TOML 파일 내보내기 클래스"""
     
@@ -58,7 +79,7 @@ class TomlExporter:
             path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(path, 'w', encoding='utf-8') as f:
-                toml.dump(data, f)
+                f.write(dumps_toml(data))
             
             logger.info(f"TOML file saved successfully: {filepath}")
             return True
@@ -67,6 +88,18 @@ class TomlExporter:
             logger.exception(f"Failed to save TOML file: {e}")
             return False
     
+    def to_bytes(self, data: Dict[str, Any]) -> bytes:
+        """
+        데이터를 TOML 바이트(UTF-8)로 변환
+        
+        Args:
+            data: 변환할 데이터
+        
+        Returns:
+            TOML 문서 바이트
+        """
+        return dumps_toml(data).encode('utf-8')
+    
     def generate_filename(self, alert_id: str = None) -> str:
         """
         TOML 파일명 생성
@@ -13,6 +13,19 @@ from .toml_config import toml_config
 
 logger = logging.getLogger(__name__)
 
+# 주소 구 단위 추출 패턴 (우선순위 순)
+DISTRICT_PATTERNS = tuple(re.compile(p) for p in (
+    r'(.*?[시도])\s+(.*?[구군])',  # 시/도 + 구/군
+    r'(서울특별시|부산광역시|대구광역시|인천광역시|광주광역시|대전광역시|울산광역시|세종특별자치시)\s+(.*?[구군])',
+    r'(.*?특별시|.*?광역시|.*?시)\s+(.*?[구군])',
+    r'(서울|부산|대구|인천|광주|대전|울산|세종)\s+(.*?[구군])',
+    r'(.*?도)\s+(.*?[시군])\s+(.*?[구읍면])',  # 도 + 시/군 + 구/읍/면
+))
+
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_HANGUL_RE = re.compile(r'[\uAC00-\uD7A3]')  # 한글 유니코드 범위
+_ENGLISH_NAME_RE = re.compile(r'([A-Za-z]+)\s+([A-Za-z\s]+)')
+
 
 class TomlDataProcessor:
     """TOML 데이터 처리 클래스"""
@@ -76,16 +89,8 @@ class TomlDataProcessor:
             return ''
         
         # 다양한 주소 형식 처리
-        patterns = [
-            r'(.*?[시도])\s+(.*?[구군])',  # 시/도 + 구/군
-            r'(서울특별시|부산광역시|대구광역시|인천광역시|광주광역시|대전광역시|울산광역시|세종특별자치시)\s+(.*?[구군])',
-            r'(.*?특별시|.*?광역시|.*?시)\s+(.*?[구군])',
-            r'(서울|부산|대구|인천|광주|대전|울산|세종)\s+(.*?[구군])',
-            r'(.*?도)\s+(.*?[시군])\s+(.*?[구읍면])',  # 도 + 시/군 + 구/읍/면
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, address)
+        for pattern in DISTRICT_PATTERNS:
+            match = pattern.search(address)
             if match:
                 if len(match.groups()) >= 3:  # 도 + 시/군 + 구/읍/면
                     return f"{match.group(1)} {match.group(2)} {match.group(3)}"
@@ -106,7 +111,7 @@ class TomlDataProcessor:
             return birthdate
             
         # 다양한 형식 처리
-        date_clean = re.sub(r'[^0-9]', '', str(birthdate))
+        date_clean = _NON_DIGIT_RE.sub('', str(birthdate))
         
         # 연도 추출 (최소 4자리)
         if len(date_clean) >= 4:
@@ -122,11 +127,11 @@ class TomlDataProcessor:
             return value
             
         # 한글 이름 처리 (첫 글자는 성으로 간주)
-        if re.match(r'[\uAC00-\uD7A3]', value[0]):  # 한글 유니코드 범위
+        if _HANGUL_RE.match(value[0]):
             return f"{value[0]}**"
             
         # 영문 이름 처리
-        match = re.match(r'([A-Za-z]+)\s+([A-Za-z\s]+)', value)
+        match = _ENGLISH_NAME_RE.match(value)
         if match:
             # 영문 이름은 성이 뒤에 오는 경우가 많음
             first_name, last_name = match.groups()
@@ -4,9 +4,14 @@
 Oracle (jaydebeapi) + Redshift (psycopg2)
 """
 
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable, Hashable, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import jaydebeapi
@@ -55,6 +60,153 @@ DEFAULT_CONFIG = {
 }
 
 
+# ==================== 연결 풀 ====================
+# 유휴 연결 보관 시간 (초)
+POOL_IDLE_TIMEOUT = 120
+
+# 이 시간(초) 이상 유휴였던 연결은 재사용 전 서버 왕복으로 상태 확인
+POOL_VALIDATE_AFTER = 30
+POOL_VALIDATE_TIMEOUT = 2
+
+
+class ConnectionPool:
+    """
+    프로세스 단위 유휴 연결 보관소
+    transaction() 종료 시 연결을 닫지 않고 보관했다가 같은 접속 정보의 다음 요청에서 재사용
+    """
+    
+    def __init__(self, name: str, close: Callable[[Any], None],
+                 is_alive: Callable[[Any, float], bool], max_idle: int = 4,
+                 idle_timeout: float = POOL_IDLE_TIMEOUT):
+        """
+        Args:
+            name: 로그 표시용 이름
+            close: 연결 종료 함수
+            is_alive: 재사용 전 연결 상태 확인 함수 (연결, 유휴 시간(초))
+            max_idle: 접속 정보별 최대 유휴 연결 수
+            idle_timeout: 유휴 연결 보관 시간 (초) - 초과 시 종료
+        """
+        self.name = name
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._close = close
+        self._is_alive = is_alive
+        self._idle: Dict[Hashable, List[Tuple[Any, float]]] = {}  # key → [(연결, 반환 시각)]
+        self._lock = threading.Lock()
+    
+    def acquire(self, key: Hashable) -> Optional[Any]:
+        """유휴 연결 반환 (없으면 None)"""
+        for conn in self._evict_expired():
+            self.discard(conn)
+        
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn, returned_at = idle.pop()
+            
+            try:
+                if self._is_alive(conn, time.monotonic() - returned_at):
+                    logger.debug(f"{self.name} connection reused from pool")
+                    return conn
+            except Exception as e:
+                logger.debug(f"{self.name} pooled connection check failed: {e}")
+            self.discard(conn)
+    
+    def release(self, key: Hashable, conn: Any):
+        """연결 반환 (보관 한도 초과 시 종료)"""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append((conn, time.monotonic()))
+                logger.debug(f"{self.name} connection returned to pool")
+                return
+        self.discard(conn)
+    
+    def _evict_expired(self) -> List[Any]:
+        """
+        보관 시간이 지난 유휴 연결 분리 (별도 스레드 없이 풀 사용 시점에 정리)
+        서버 측 idle timeout으로 끊기기 전에 먼저 닫기 위함
+        
+        Returns:
+            종료할 연결 목록
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._lock:
+            for key in list(self._idle):
+                idle = self._idle[key]
+                # 반환 순서대로 쌓이므로 앞쪽이 가장 오래된 연결
+                while idle and idle[0][1] < deadline:
+                    expired.append(idle.pop(0)[0])
+                if not idle:
+                    del self._idle[key]
+        return expired
+    
+    def discard(self, conn: Any):
+        """연결 종료"""
+        try:
+            self._close(conn)
+            logger.debug(f"{self.name} connection closed")
+        except Exception as e:
+            logger.warning(f"Error closing {self.name} connection: {e}")
+
+
+def _credential_key(*parts: str) -> tuple:
+    """연결 풀 키 생성 (비밀번호는 해시로만 보관)"""
+    *identity, password = parts
+    return (*identity, hashlib.sha256((password or '').encode('utf-8')).hexdigest())
+
+
+def _oracle_is_alive(conn, idle_seconds: float) -> bool:
+    """Oracle 연결 상태 확인 (오래 유휴였던 연결만 JDBC isValid로 서버 확인)"""
+    if conn.jconn.isClosed():
+        return False
+    if idle_seconds < POOL_VALIDATE_AFTER:
+        return True
+    return bool(conn.jconn.isValid(POOL_VALIDATE_TIMEOUT))
+
+
+def _redshift_is_alive(conn, idle_seconds: float) -> bool:
+    """Redshift 연결 상태 확인 (오래 유휴였던 연결만 SELECT 1로 서버 확인)"""
+    if conn.closed != 0:
+        return False
+    if idle_seconds < POOL_VALIDATE_AFTER:
+        return True
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    return True
+
+
+_oracle_pool = ConnectionPool(
+    'Oracle',
+    close=lambda conn: conn.close(),
+    is_alive=_oracle_is_alive
+)
+
+_redshift_pool = ConnectionPool(
+    'Redshift',
+    close=lambda conn: conn.close(),
+    is_alive=_redshift_is_alive
+)
+
+
+# Oracle 접속(handshake) 제한 시간 (밀리초) - Redshift connect_timeout(10초)과 동일
+ORACLE_CONNECT_TIMEOUT_MS = 10000
+
+# Oracle 조회 시 한 번의 왕복으로 가져올 행 수 (JDBC 기본값 10)
+ORACLE_ROW_PREFETCH = 1000
+
+# 풀링된 Oracle 연결의 암시적 Statement 캐시 크기 (동일 SQL 재파싱 방지)
+ORACLE_STATEMENT_CACHE_SIZE = 50
+
+# Oracle JDBC 드라이버 기본값
+ORACLE_DRIVER_PATH = r'C:\ojdbc11-21.5.0.0.jar'
+ORACLE_DRIVER_CLASS = 'oracle.jdbc.driver.OracleDriver'
+
+
 # ==================== Oracle 연결 클래스 ====================
 class OracleConnection:
     """Oracle 데이터베이스 연결 관리 클래스"""
@@ -64,31 +216,84 @@ class OracleConnection:
         self.jdbc_url = jdbc_url
         self.username = username
         self.password = password
-        self.driver_path = driver_path or r'C:\ojdbc11-21.5.0.0.jar'
-        self.driver_class = driver_class or 'oracle.jdbc.driver.OracleDriver'
+        self.driver_path = driver_path or ORACLE_DRIVER_PATH
+        self.driver_class = driver_class or ORACLE_DRIVER_CLASS
     
     @classmethod
     def from_session(cls, session_data: Dict[str, Any]) -> 'OracleConnection':
         """세션 데이터에서 연결 객체 생성"""
         return cls(**session_data)
     
+    @property
+    def identity(self) -> str:
+        """접속 대상/사용자 식별 문자열 (캐시 키 구분용, 비밀번호 제외)"""
+        return f"{self.jdbc_url}:{self.username}"
+    
+    @staticmethod
+    def warm_jvm(driver_path: Optional[str] = None,
+                 driver_class: Optional[str] = None) -> bool:
+        """
+        JVM 기동 및 JDBC 드라이버 클래스 선로딩 (프로세스당 1회)
+        jaydebeapi는 JVM이 이미 떠 있으면 재기동하지 않으므로 첫 요청의 기동 비용 제거
+        
+        Returns:
+            선로딩 성공 여부
+        """
+        import jpype
+        
+        driver_path = driver_path or ORACLE_DRIVER_PATH
+        driver_class = driver_class or ORACLE_DRIVER_CLASS
+        
+        try:
+            if not jpype.isJVMStarted():
+                # jaydebeapi와 동일한 classpath 구성 (드라이버 + CLASSPATH 환경변수)
+                class_path = [driver_path]
+                if os.environ.get('CLASSPATH'):
+                    class_path.append(os.environ['CLASSPATH'])
+                
+                jpype.startJVM(
+                    jpype.getDefaultJVMPath(),
+                    f"-Djava.class.path={os.path.pathsep.join(class_path)}",
+                    ignoreUnrecognized=True,
+                    convertStrings=True
+                )
+                logger.info("JVM started for Oracle JDBC")
+            
+            jpype.java.lang.Class.forName(driver_class)
+            logger.info(f"Oracle JDBC driver preloaded: {driver_class}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Oracle JDBC warm-up skipped: {e}")
+            return False
+    
     @staticmethod
+    @lru_cache(maxsize=128)
     def build_jdbc_url(host: str, port: str, service_name: str) -> str:
-        """JDBC URL 생성"""
+        """JDBC URL 생성 (동일 접속 정보는 재사용)"""
         return f"jdbc:oracle:thin:@//{host}:{port}/{service_name}"
     
     @contextmanager
-    def transaction(self, prefetch: int = 1000):
-        """트랜잭션 컨텍스트 매니저"""
+    def transaction(self, prefetch: int = ORACLE_ROW_PREFETCH):
+        """트랜잭션 컨텍스트 매니저 (정상 종료된 연결은 풀에 반환)"""
+        pool_key = _credential_key(self.jdbc_url, self.username, self.password)
         conn = None
+        reusable = False
         try:
-            conn = jaydebeapi.connect(
-                self.driver_class,
-                self.jdbc_url,
-                [self.username, self.password],
-                self.driver_path
-            )
-            logger.debug("Oracle connection opened")
+            conn = _oracle_pool.acquire(pool_key)
+            if conn is None:
+                conn = jaydebeapi.connect(
+                    self.driver_class,
+                    self.jdbc_url,
+                    {
+                        'user': self.username,
+                        'password': self.password,
+                        'oracle.net.CONNECT_TIMEOUT': str(ORACLE_CONNECT_TIMEOUT_MS),
+                        'oracle.jdbc.implicitStatementCacheSize': str(ORACLE_STATEMENT_CACHE_SIZE)
+                    },
+                    self.driver_path
+                )
+                logger.debug("Oracle connection opened")
             
             try:
                 conn.jconn.setDefaultRowPrefetch(prefetch)
@@ -96,22 +301,25 @@ class OracleConnection:
                 logger.debug(f"Could not set row prefetch: {e}")
             
             yield conn
+            reusable = True
             
         except Exception as e:
             logger.exception(f"Oracle connection failed: {e}")
             raise OracleConnectionError(f"Oracle 연결 실패: {e}")
         finally:
             if conn:
-                try:
-                    conn.close()
-                    logger.debug("Oracle connection closed")
-                except Exception as e:
-                    logger.warning(f"Error closing Oracle connection: {e}")
+                if reusable:
+                    _oracle_pool.release(pool_key, conn)
+                else:
+                    _oracle_pool.discard(conn)
     
     def test_connection(self) -> bool:
-        """연결 테스트"""
+        """연결 테스트 (풀에서 재사용한 연결도 항상 서버 왕복으로 확인)"""
         try:
-            with self.transaction():
+            with self.transaction() as conn:
+                if not conn.jconn.isValid(POOL_VALIDATE_TIMEOUT):
+                    # 예외로 종료하여 응답 없는 연결이 풀에 반환되지 않도록 함
+                    raise OracleConnectionError("Oracle 서버 응답 없음")
                 return True
         except Exception:
             return False
@@ -135,36 +343,52 @@ class RedshiftConnection:
         """세션 데이터에서 연결 객체 생성"""
         return cls(**session_data)
     
+    @property
+    def identity(self) -> str:
+        """접속 대상/사용자 식별 문자열 (캐시 키 구분용, 비밀번호 제외)"""
+        params = self.conn_params
+        return f"{params['host']}:{params['port']}/{params['dbname']}:{params['user']}"
+    
     @contextmanager
     def transaction(self):
-        """트랜잭션 컨텍스트 매니저"""
+        """트랜잭션 컨텍스트 매니저 (정상 종료된 연결은 풀에 반환)"""
+        pool_key = _credential_key(
+            self.conn_params['host'],
+            str(self.conn_params['port']),
+            self.conn_params['dbname'],
+            self.conn_params['user'],
+            self.conn_params['password']
+        )
         conn = None
+        reusable = False
         try:
-            sslmode = 'prefer' if self.conn_params['host'] in ['127.0.0.1', 'localhost'] else 'require'
-            
-            conn = psycopg2.connect(
-                **self.conn_params,
-                sslmode=sslmode,
-                connect_timeout=10
-            )
-            conn.set_session(readonly=True, autocommit=True)
-            logger.debug("Redshift connection opened")
+            conn = _redshift_pool.acquire(pool_key)
+            if conn is None:
+                sslmode = 'prefer' if self.conn_params['host'] in ['127.0.0.1', 'localhost'] else 'require'
+                
+                conn = psycopg2.connect(
+                    **self.conn_params,
+                    sslmode=sslmode,
+                    connect_timeout=10
+                )
+                conn.set_session(readonly=True, autocommit=True)
+                logger.debug("Redshift connection opened")
             
             yield conn
+            reusable = True
             
         except Exception as e:
             logger.exception(f"Redshift connection failed: {e}")
             raise RedshiftConnectionError(f"Redshift 연결 실패: {e}")
         finally:
             if conn:
-                try:
-                    conn.close()
-                    logger.debug("Redshift connection closed")
-                except Exception as e:
-                    logger.warning(f"Error closing Redshift connection: {e}")
+                if reusable:
+                    _redshift_pool.release(pool_key, conn)
+                else:
+                    _redshift_pool.discard(conn)
     
     def test_connection(self) -> bool:
-        """연결 테스트"""
+        """연결 테스트 (풀에서 재사용한 연결도 항상 SELECT 1로 서버 확인)"""
         try:
             with self.transaction() as conn:
                 with conn.cursor() as cursor:
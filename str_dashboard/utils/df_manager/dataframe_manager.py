@@ -67,28 +67,49 @@ class DataFrameManager:
                 
                 df = pd.DataFrame(processed_rows, columns=columns)
             
-            # 데이터셋 저장
-            self.datasets[name] = {
-                'dataframe': df,
-                'columns': columns,
-                'row_count': len(rows),
-                'created_at': datetime.now().isoformat(),
-                'metadata': extra_metadata
-            }
-            
-            logger.info(f"Dataset '{name}' added: {len(rows)} rows, {len(columns)} columns")
-            return True
+            return self.add_dataframe(name, df, **extra_metadata)
             
         except Exception as e:
             logger.error(f"Failed to add dataset '{name}': {e}")
             return False
     
+    def add_dataframe(self, name: str, df: pd.DataFrame, **extra_metadata):
+        """
+        이미 생성된 DataFrame을 데이터셋으로 추가 (행 리스트 변환 없이 그대로 보관)
+        
+        Args:
+            name: 데이터셋 이름
+            df: 저장할 DataFrame
+            **extra_metadata: 추가 메타데이터
+        """
+        self.datasets[name] = {
+            'dataframe': df,
+            'columns': list(df.columns),
+            'row_count': len(df),
+            'created_at': datetime.now().isoformat(),
+            'metadata': extra_metadata
+        }
+        
+        logger.info(f"Dataset '{name}' added: {len(df)} rows, {len(df.columns)} columns")
+        return True
+    
     def get_dataframe(self, name: str) -> Optional[pd.DataFrame]:
         """특정 데이터셋의 DataFrame 반환"""
         if name in self.datasets:
             return self.datasets[name]['dataframe']
         return None
     
+    def get_row_dict(self, name: str, index: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        특정 데이터셋의 한 행을 {컬럼명: 값} 딕셔너리로 반환
+        단일 행만 필요한 경우 Series 생성(혼합 dtype의 object 변환) 없이 값 그대로 조회
+        """
+        df = self.get_dataframe(name)
+        if df is None or not 0 <= index < len(df):
+            return None
+        values = next(df.iloc[index:index + 1].itertuples(index=False, name=None))
+        return dict(zip(df.columns, values))
+    
     def get_dataset_info(self, name: str) -> Dict[str, Any]:
         """데이터셋 정보 반환"""
         if name in self.datasets:
@@ -108,7 +129,7 @@ class DataFrameManager:
         """모든 데이터셋 요약 정보"""
         summary = {
             'alert_id': self.alert_id,
-            'metadata': self.metadata,
+            'metadata': self._get_summary_metadata(),
             'datasets': {},
             'total_memory': 0
         }
@@ -129,6 +150,17 @@ class DataFrameManager:
         
         return summary
     
+    def _get_summary_metadata(self) -> Dict[str, Any]:
+        """
+        요약용 메타데이터 반환
+        stage_N 항목은 각 Stage의 전체 행 데이터(예: Orderbook)를 포함하므로
+        JSON 응답에서는 제외하고 데이터셋 조회로만 접근
+        """
+        return {
+            key: value for key, value in self.metadata.items()
+            if not key.startswith('stage_')
+        }
+    
     def export_to_dict(self) -> Dict[str, Any]:
         """모든 데이터를 딕셔너리로 export (세션 저장용)"""
         export_data = {
@@ -140,22 +172,16 @@ class DataFrameManager:
         for name, dataset in self.datasets.items():
             df = dataset['dataframe']
             
-            # DataFrame을 리스트로 변환
-            df_cleaned = df.copy()
-            
-            # NaN, NaT 처리
-            for col in df_cleaned.columns:
-                if df_cleaned[col].dtype == object:
-                    df_cleaned[col] = df_cleaned[col].apply(
-                        lambda x: float(x) if isinstance(x, Decimal) else x
-                    )
-                df_cleaned[col] = df_cleaned[col].replace({pd.NaT: None})
-                if pd.api.types.is_numeric_dtype(df_cleaned[col]):
-                    df_cleaned[col] = df_cleaned[col].replace({np.nan: None})
+            # NaN/NaT → None을 컬럼별 반복 없이 한 번에 처리
+            # (Decimal은 add_dataset 단계에서 이미 float로 변환되고, from_dict 시에도 다시 변환됨)
+            if df.empty:
+                rows = []
+            else:
+                rows = df.astype(object).where(df.notna(), None).values.tolist()
             
             export_data['datasets'][name] = {
-                'columns': list(df_cleaned.columns),
-                'rows': df_cleaned.values.tolist() if not df_cleaned.empty else [],
+                'columns': list(df.columns),
+                'rows': rows,
                 'metadata': dataset.get('metadata', {})
             }
         
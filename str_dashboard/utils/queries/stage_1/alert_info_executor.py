@@ -3,11 +3,14 @@
 ALERT 정보 쿼리 실행 모듈
 """
 
+import hashlib
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+from django.core.cache import cache
+
 from .sql_templates import (
     INITIAL_ALERT_QUERY,
     MONTHLY_ALERT_QUERY,
@@ -16,18 +19,24 @@ from .sql_templates import (
 
 logger = logging.getLogger(__name__)
 
+# Rule 히스토리 집계 캐시 유지 시간 (초)
+# 전체 STR 보고 이력을 집계하는 쿼리이므로 짧은 주기로만 갱신
+RULE_HISTORY_CACHE_TIMEOUT = 300
+
 
 class AlertInfoExecutor:
     """
     Stage 1: ALERT 정보 및 Rule 히스토리 조회 클래스
     """
     
-    def __init__(self, db_connection):
+    def __init__(self, db_connection, cache_scope: str = ''):
         """
         Args:
             db_connection: Oracle 데이터베이스 연결 객체
+            cache_scope: Oracle 접속 식별 문자열 (접속 대상/사용자별로 캐시를 구분)
         """
         self.db_conn = db_connection
+        self.cache_scope = cache_scope
         
     def execute(self, alert_id: str) -> Dict[str, Any]:
         """
@@ -230,7 +239,23 @@ class AlertInfoExecutor:
         return metadata
     
     def _get_exact_rule_history(self, rule_combo: str) -> Dict[str, Any]:
-        """정확히 일치하는 Rule 조합의 과거 이력 조회"""
+        """정확히 일치하는 Rule 조합의 과거 이력 조회 (Oracle 접속 대상/사용자 및 Rule 조합별 캐시)"""
+        scope_digest = hashlib.sha1(self.cache_scope.encode('utf-8')).hexdigest()
+        combo_digest = hashlib.sha1(rule_combo.encode('utf-8')).hexdigest()
+        cache_key = f"rule_history:{scope_digest}:{combo_digest}"
+        
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[Stage 1] Rule history cache hit for: {rule_combo}")
+            return cached
+        
+        result = self._query_exact_rule_history(rule_combo)
+        if result['success']:
+            cache.set(cache_key, result, RULE_HISTORY_CACHE_TIMEOUT)
+        return result
+    
+    def _query_exact_rule_history(self, rule_combo: str) -> Dict[str, Any]:
+        """Rule 히스토리 집계 쿼리 실행"""
         try:
             with self.db_conn.cursor() as cursor:
                 cursor.execute(RULE_HISTORY_QUERY, [rule_combo])
@@ -157,10 +157,11 @@ class AlertInfoProcessor:
         
         # Rule 히스토리 분석
         if self.rule_history_exact_df is not None and not self.rule_history_exact_df.empty:
+            # 첫 행의 값만 필요하므로 행 전체(Series) 생성 없이 컬럼별 단일 값 조회
             analysis['rule_history'] = {
                 'has_history': True,
-                'occurrence_count': self.rule_history_exact_df.iloc[0]['OCCURRENCE_COUNT'],
-                'str_ratio': self.rule_history_exact_df.iloc[0]['STR_RATIO']
+                'occurrence_count': self.rule_history_exact_df['OCCURRENCE_COUNT'].iat[0],
+                'str_ratio': self.rule_history_exact_df['STR_RATIO'].iat[0]
             }
         else:
             analysis['rule_history'] = {'has_history': False}
@@ -212,17 +213,20 @@ class AlertInfoProcessor:
             'dataframes': {}
         }
         
-        # DataFrame을 dict로 변환
+        # 원본 행에서 변형 없이 만든 DataFrame은 원본 행을 그대로 사용
+        # (DataFrame -> ndarray -> list 재변환 생략)
         if self.initial_df is not None:
+            initial_data = execution_result['initial_info']
             export_data['dataframes']['initial'] = {
-                'columns': self.initial_df.columns.tolist(),
-                'rows': self.initial_df.values.tolist()
+                'columns': list(initial_data['columns']),
+                'rows': initial_data['rows']
             }
         
         if self.monthly_df is not None:
+            monthly_data = execution_result['monthly_data']
             export_data['dataframes']['monthly'] = {
-                'columns': self.monthly_df.columns.tolist(),
-                'rows': self.monthly_df.values.tolist()
+                'columns': list(monthly_data['columns']),
+                'rows': monthly_data['rows']
             }
         
         if self.rule_history_exact_df is not None and not self.rule_history_exact_df.empty:
@@ -232,9 +236,10 @@ class AlertInfoProcessor:
             }
         
         if self.rule_history_similar_df is not None and not self.rule_history_similar_df.empty:
+            similar_matches = execution_result['rule_history']['similar_matches']
             export_data['dataframes']['rule_history_similar'] = {
-                'columns': self.rule_history_similar_df.columns.tolist(),
-                'rows': self.rule_history_similar_df.values.tolist()
+                'columns': list(similar_matches['columns']),
+                'rows': similar_matches['rows']
             }
         
         return export_data
\ No newline at end of file
@@ -57,12 +57,13 @@ WITH R_SRC AS (
     WHERE STR_RULE_ID IS NOT NULL
 ),
 R AS (
-    -- 보고서별 Rule ID 조합 생성
+    -- 보고서별 Rule ID 조합 생성 후 현재 Alert의 Rule 조합과 일치하는 보고서만 남김
     SELECT
         STR_RPT_MNGT_NO,
         LISTAGG(STR_RULE_ID, ',') WITHIN GROUP (ORDER BY STR_RULE_ID) AS STR_RULE_ID_LIST
     FROM R_SRC
     GROUP BY STR_RPT_MNGT_NO
+    HAVING LISTAGG(STR_RULE_ID, ',') WITHIN GROUP (ORDER BY STR_RULE_ID) = ?  -- 현재 Alert의 Rule 조합
 ),
 UPER_SRC AS (
     -- 상위 의심거래 패턴
@@ -74,6 +75,7 @@ UPER_SRC AS (
     JOIN STR_SSPC_PTTN_BASE B
         ON B.UPER_STR_SSPC_PTTN_CD = L.UPER_STR_SSPC_PTTN_CD
     WHERE L.UPER_STR_SSPC_PTTN_CD IS NOT NULL
+      AND L.STR_RPT_MNGT_NO IN (SELECT STR_RPT_MNGT_NO FROM R)
 ),
 UPER AS (
     -- 상위 패턴 집계
@@ -94,6 +96,7 @@ LWER_SRC AS (
     JOIN STR_SSPC_PTTN_BASE B
         ON B.STR_SSPC_PTTN_CD = L.LWER_STR_SSPC_PTTN_CD
     WHERE L.LWER_STR_SSPC_PTTN_CD IS NOT NULL
+      AND L.STR_RPT_MNGT_NO IN (SELECT STR_RPT_MNGT_NO FROM R)
 ),
 LWER AS (
     -- 하위 패턴 집계
@@ -143,7 +146,6 @@ SELECT
 FROM RPT_INFO RI
 LEFT JOIN UPER U ON U.STR_RPT_MNGT_NO = RI.STR_RPT_MNGT_NO
 LEFT JOIN LWER L ON L.STR_RPT_MNGT_NO = RI.STR_RPT_MNGT_NO
-WHERE RI.STR_RULE_ID_LIST = ?  -- 현재 Alert의 Rule 조합
 GROUP BY RI.STR_RULE_ID_LIST
 """
 
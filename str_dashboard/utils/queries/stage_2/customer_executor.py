@@ -15,11 +15,30 @@ from .sql_templates import (
     CORP_RELATED_PERSONS_QUERY,
     PERSON_INTERNAL_TRANSACTION_QUERY,
     PERSON_TRANSACTION_DETAIL_QUERY,
+    CUSTOMER_MID_QUERY,
     DUPLICATE_PERSONS_QUERY
 )
 
 logger = logging.getLogger(__name__)
 
+# 중복 검색용 컬럼 → 파라미터 매핑
+DUPLICATE_FIELD_MAP = (
+    ('거주지주소', 'address'),
+    ('거주지상세주소', 'detail_address'),
+    ('직장명', 'workplace_name'),
+    ('직장주소', 'workplace_address'),
+    ('직장상세주소', 'workplace_detail_address'),
+    ('연락처', 'phone'),
+)
+
+# Oracle IN 목록 최대 항목 수 (초과 시 ORA-01795)
+ORACLE_IN_LIST_LIMIT = 1000
+
+
+def _chunked(values: List[str], size: int = ORACLE_IN_LIST_LIMIT) -> List[List[str]]:
+    """IN 목록 바인드 수 제한에 맞춰 분할"""
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
 
 class CustomerExecutor:
     """
@@ -170,12 +189,15 @@ class CustomerExecutor:
                 rows = cursor.fetchall()
                 cols = [desc[0] for desc in cursor.description]
                 
+                # 관련인 MID는 관련인별로 조회하지 않고 한 번에 조회
+                mid_map = self._get_mids_for_customers(
+                    [row[0] for row in rows if row and row[0]]
+                )
+                
                 related_data = []
                 for row in rows:
                     related_cust_id = row[0] if len(row) > 0 else None
-                    mid = None
-                    if related_cust_id:
-                        mid = self._get_mid_for_customer(related_cust_id)
+                    mid = mid_map.get(related_cust_id) if related_cust_id else None
                     
                     related_person = {
                         'related_cust_id': related_cust_id,
@@ -202,17 +224,33 @@ class CustomerExecutor:
             logger.error(f"[Stage 2] Error in corp related persons: {e}")
             return {'success': True, 'data': []}
     
-    def _get_mid_for_customer(self, cust_id: str) -> Optional[str]:
-        """고객 ID로 MID 조회"""
+    def _get_mids_for_customers(self, cust_ids: List[str]) -> Dict[str, Optional[str]]:
+        """고객 ID 목록으로 MID 일괄 조회 (고객 ID → MID)"""
+        if not cust_ids:
+            return {}
+        
         try:
-            query = "SELECT MEM_ID FROM BTCAMLDB_OWN.KYC_MEM_BASE WHERE CUST_ID = :cust_id"
+            mid_map = {}
             with self.db_conn.cursor() as cursor:
-                cursor.execute(query, {'cust_id': cust_id})
-                result = cursor.fetchone()
-                return result[0] if result else None
+                for chunk in _chunked(list(dict.fromkeys(cust_ids))):
+                    params = {}
+                    bind_names = []
+                    for i, cust_id in enumerate(chunk):
+                        bind_name = f'cust_{i}'
+                        params[bind_name] = cust_id
+                        bind_names.append(f':{bind_name}')
+                    
+                    query = CUSTOMER_MID_QUERY.replace('{cust_binds}', ', '.join(bind_names))
+                    cursor.execute(query, params)
+                    
+                    # 고객 ID당 MID가 여러 건이면 첫 번째 값 사용
+                    for row_cust_id, mem_id in cursor.fetchall():
+                        mid_map.setdefault(row_cust_id, mem_id)
+            return mid_map
+            
         except Exception as e:
-            logger.error(f"[Stage 2] Error getting MID for {cust_id}: {e}")
-            return None
+            logger.error(f"[Stage 2] Error getting MIDs for {len(cust_ids)} customer(s): {e}")
+            return {}
 
 
     def _get_duplicate_persons(self, cust_id: str, 
@@ -225,6 +263,11 @@ class CustomerExecutor:
                 logger.warning("[Stage 2] No duplicate params extracted")
                 return {'success': True, 'columns': [], 'rows': []}
             
+            # 비교 가능한 값이 하나도 없으면 조회 생략
+            if not any(dup_params.values()):
+                logger.debug("[Stage 2] All duplicate params empty - skipping duplicate query")
+                return {'success': True, 'columns': [], 'rows': []}
+            
             # Oracle은 named 바인딩에서 동일한 이름 재사용 가능
             params = {
                 'cust_id': cust_id,
@@ -260,24 +303,14 @@ class CustomerExecutor:
         if not customer_result.get('rows'):
             return None
         
-        cols = customer_result['columns']
-        row = customer_result['rows'][0]
+        # 컬럼명 → 값 매핑을 한 번만 생성 (필드마다 컬럼 목록 선형 탐색 방지)
+        record = dict(zip(customer_result['columns'], customer_result['rows'][0]))
         
         params = {}
         
-        field_map = {
-            '거주지주소': 'address',
-            '거주지상세주소': 'detail_address',
-            '직장명': 'workplace_name',
-            '직장주소': 'workplace_address',
-            '직장상세주소': 'workplace_detail_address',
-            '연락처': 'phone'
-        }
-        
-        for col_name, param_name in field_map.items():
-            if col_name in cols:
-                idx = cols.index(col_name)
-                value = row[idx]
+        for col_name, param_name in DUPLICATE_FIELD_MAP:
+            if col_name in record:
+                value = record[col_name]
                 
                 if param_name == 'phone' and value:
                     params['phone_suffix'] = str(value)[-4:] if len(str(value)) >= 4 else ''
@@ -308,6 +341,12 @@ class CustomerExecutor:
             if not transaction_rows:
                 return {'success': True, 'data': []}
             
+            # 종목별 거래 상세 - 관련인 전체를 한 번에 조회
+            related_cust_ids = [tx_row[0] for tx_row in transaction_rows if tx_row and tx_row[0]]
+            coin_transactions_map = self._get_coin_transaction_details(
+                cust_id, related_cust_ids, start_dt, end_dt
+            )
+            
             related_data = []
             for tx_row in transaction_rows:
                 related_cust_id = tx_row[0] if len(tx_row) > 0 else None
@@ -319,29 +358,25 @@ class CustomerExecutor:
                 # KYC 정보 조회 (신원 확인 정보)
                 detail_result = self._get_customer_info(related_cust_id)
                 
-                # 종목별 거래 상세 조회
-                coin_transactions = self._get_coin_transaction_details(
-                    cust_id, related_cust_id, start_dt, end_dt
-                )
+                coin_transactions = coin_transactions_map.get(related_cust_id, [])
                 
                 if detail_result['success'] and detail_result['rows']:
                     detail_row = detail_result['rows'][0]
                     detail_cols = detail_result['columns']
-                    
-                    mid_value = self._get_value_by_column(detail_row, detail_cols, 'MID')
+                    detail = self._row_to_dict(detail_row, detail_cols)
                     
                     # DM에서 조회한 이름 우선 사용
-                    related_name = name if name else self._get_value_by_column(detail_row, detail_cols, '성명')
+                    related_name = name if name else detail.get('성명')
                     
                     related_person = {
                         'related_cust_id': related_cust_id,
-                        'mid': mid_value,
+                        'mid': detail.get('MID'),
                         'relation_type': '내부거래상대방',
                         'name': related_name,
-                        'name_en': self._get_value_by_column(detail_row, detail_cols, '영문명'),
-                        'birth_date': self._get_value_by_column(detail_row, detail_cols, '생년월일'),
-                        'gender': self._get_value_by_column(detail_row, detail_cols, '성별'),
-                        'id_number': self._get_value_by_column(detail_row, detail_cols, '실명번호'),
+                        'name_en': detail.get('영문명'),
+                        'birth_date': detail.get('생년월일'),
+                        'gender': detail.get('성별'),
+                        'id_number': detail.get('실명번호'),
                         'stake_rate': None,
                         'relation_code': 'INTERNAL',
                         'internal_deposit_amount': deposit_amount,
@@ -381,37 +416,57 @@ class CustomerExecutor:
             logger.error(f"[Stage 2] Error in person related query: {e}")
             return {'success': True, 'data': []}
 
-    def _get_coin_transaction_details(self, cust_id: str, related_cust_id: str,
-                                    start_dt: str, end_dt: str) -> List[Dict]:
-        """종목별 거래 상세 조회 - DM 테이블 사용"""
+    def _get_coin_transaction_details(self, cust_id: str, related_cust_ids: List[str],
+                                    start_dt: str, end_dt: str) -> Dict[str, List[Dict]]:
+        """
+        종목별 거래 상세 조회 - DM 테이블 사용
+        관련인별로 쿼리를 반복하지 않고 한 번에 조회한 뒤 관련인 고객ID로 그룹핑
+        """
+        if not related_cust_ids:
+            return {}
+        
         try:
-            params = {
-                'cust_id': cust_id,
-                'related_cust_id': related_cust_id,
-                'start_date': start_dt,
-                'end_date': end_dt
-            }
-            
+            rows = []
             with self.db_conn.cursor() as cursor:
-                cursor.execute(PERSON_TRANSACTION_DETAIL_QUERY, params)
-                rows = cursor.fetchall()
-                
-                coin_details = []
-                for row in rows:
-                    coin_detail = {
-                        '종목': row[1] if len(row) > 1 else None,
-                        '거래구분': row[2] if len(row) > 2 else None,
-                        '거래수량': float(row[3]) if len(row) > 3 and row[3] else 0,
-                        '거래금액': float(row[4]) if len(row) > 4 and row[4] else 0,
-                        '거래건수': int(row[5]) if len(row) > 5 and row[5] else 0
-                    }
-                    coin_details.append(coin_detail)
-                
-                return coin_details
+                # 관련인은 한 분할에만 속하므로 분할별 결과를 이어 붙여도 그룹 내 순서 유지
+                for chunk in _chunked(related_cust_ids):
+                    # 바인드 값은 SQL 내 등장 순서(cust_id → 관련인 목록 → start_date → end_date)로 구성
+                    # (위치 기반으로 바인딩되는 드라이버에서도 값이 어긋나지 않도록 함)
+                    params = {'cust_id': cust_id}
+                    bind_names = []
+                    for i, related_cust_id in enumerate(chunk):
+                        bind_name = f'related_{i}'
+                        params[bind_name] = related_cust_id
+                        bind_names.append(f':{bind_name}')
+                    params['start_date'] = start_dt
+                    params['end_date'] = end_dt
+                    
+                    query = PERSON_TRANSACTION_DETAIL_QUERY.replace(
+                        '{related_binds}', ', '.join(bind_names)
+                    )
+                    cursor.execute(query, params)
+                    rows.extend(cursor.fetchall())
+            
+            # 쿼리 결과가 거래금액 내림차순이므로 그룹 내 순서도 유지됨
+            coin_details_map = {}
+            for row in rows:
+                coin_detail = {
+                    '종목': row[1] if len(row) > 1 else None,
+                    '거래구분': row[2] if len(row) > 2 else None,
+                    '거래수량': float(row[3]) if len(row) > 3 and row[3] else 0,
+                    '거래금액': float(row[4]) if len(row) > 4 and row[4] else 0,
+                    '거래건수': int(row[5]) if len(row) > 5 and row[5] else 0
+                }
+                coin_details_map.setdefault(row[0], []).append(coin_detail)
+            
+            logger.info(f"[Stage 2] Coin transaction details: {len(rows)} row(s) "
+                       f"for {len(coin_details_map)} related person(s)")
+            
+            return coin_details_map
                 
         except Exception as e:
             logger.error(f"[Stage 2] Error getting coin transaction details: {e}")
-            return []
+            return {}
 
     def _create_unified_dataframe(self, customer_result: Dict,
                                 related_result: Dict,
@@ -458,16 +513,15 @@ class CustomerExecutor:
             
             if person.get('customer_details'):
                 details = person['customer_details']
-                cols = details['columns']
-                vals = details['values']
+                detail = self._row_to_dict(details['values'], details['columns'])
                 
-                row.append(self._get_value_by_column(vals, cols, '국적'))
-                row.append(self._get_value_by_column(vals, cols, '연락처'))
-                row.append(self._get_value_by_column(vals, cols, '이메일'))
-                row.append(self._get_value_by_column(vals, cols, '거주지주소'))
-                row.append(self._get_value_by_column(vals, cols, '직업'))
-                row.append(self._get_value_by_column(vals, cols, '직장명'))
-                row.append(self._get_value_by_column(vals, cols, '위험등급'))
+                row.append(detail.get('국적'))
+                row.append(detail.get('연락처'))
+                row.append(detail.get('이메일'))
+                row.append(detail.get('거주지주소'))
+                row.append(detail.get('직업'))
+                row.append(detail.get('직장명'))
+                row.append(detail.get('위험등급'))
             else:
                 row.extend([None] * 7)
             
@@ -493,15 +547,12 @@ class CustomerExecutor:
             'rows': unified_rows
         }
     
-    def _get_value_by_column(self, row: list, columns: list, column_name: str):
-        """컬럼명으로 값 추출"""
-        try:
-            if column_name in columns:
-                idx = columns.index(column_name)
-                return row[idx]
-        except:
-            pass
-        return None
+    def _row_to_dict(self, row: list, columns: list) -> Dict[str, Any]:
+        """
+        행을 {컬럼명: 값} 딕셔너리로 변환
+        여러 컬럼을 조회할 때 컬럼마다 columns.index()로 찾지 않도록 한 번만 매핑
+        """
+        return dict(zip(columns, row))
     
     def _format_timestamp(self, date_str: str) -> str:
         """날짜 문자열을 타임스탬프 형식으로 변환"""
@@ -75,7 +75,8 @@ class CustomerProcessor:
                 columns=customer_data['columns']
             )
             logger.info(f"[Stage 2 Processor] Customer DF: {self.customer_df.shape}")
-            logger.debug(f"[Stage 2 Processor] Customer columns: {self.customer_df.columns.tolist()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Stage 2 Processor] Customer columns: %s", self.customer_df.columns.tolist())
         
         # 관련인 정보
         related_data = execution_result.get('related_persons', {})
@@ -85,7 +86,8 @@ class CustomerProcessor:
                 columns=related_data['columns']
             )
             logger.info(f"[Stage 2 Processor] Related DF: {self.related_df.shape}")
-            logger.info(f"[Stage 2 Processor] Related columns: {self.related_df.columns.tolist()}")  # 컬럼명 로깅
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[Stage 2 Processor] Related columns: %s", self.related_df.columns.tolist())  # 컬럼명 로깅
         
         # 중복 의심 회원
         duplicate_data = execution_result.get('duplicate_persons', {})
@@ -95,7 +97,8 @@ class CustomerProcessor:
                 columns=duplicate_data['columns']
             )
             logger.info(f"[Stage 2 Processor] Duplicate DF: {self.duplicate_df.shape}")
-            logger.debug(f"[Stage 2 Processor] Duplicate columns: {self.duplicate_df.columns.tolist()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[Stage 2 Processor] Duplicate columns: %s", self.duplicate_df.columns.tolist())
         
         # 메타데이터
         self.metadata = execution_result.get('metadata', {})
@@ -116,7 +119,8 @@ class CustomerProcessor:
             # 관련인 분석
             if self.related_df is not None and not self.related_df.empty:
                 # 사용 가능한 컬럼 로깅
-                logger.debug(f"[Stage 2] Available related_df columns: {self.related_df.columns.tolist()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[Stage 2] Available related_df columns: %s", self.related_df.columns.tolist())
                 
                 # 법인 관련인 분석
                 if '관계유형' in self.related_df.columns:
@@ -138,59 +142,41 @@ class CustomerProcessor:
                         total_trans = valid_trans.sum()
                         analysis['related_persons_analysis']['total_transactions'] = int(total_trans)
                     
-                    # TOP 5 거래 상대방 - 안전한 처리
+                    # TOP 5 거래 상대방 - 행 단위 반복 없이 컬럼 연산으로 처리
                     try:
                         # 거래횟수가 유효한 행만 필터링
-                        valid_rows = self.related_df[
-                            (self.related_df['거래횟수'].notna()) & 
-                            (self.related_df['거래횟수'] > 0)
-                        ].copy()
+                        trans_counts = pd.to_numeric(self.related_df['거래횟수'], errors='coerce')
+                        valid_mask = trans_counts > 0
                         
-                        if not valid_rows.empty:
-                            # 내부거래 금액 합계 계산 (선택적)
-                            if '내부입고금액' in valid_rows.columns and '내부출고금액' in valid_rows.columns:
-                                valid_rows['총거래금액'] = (
-                                    valid_rows['내부입고금액'].fillna(0) + 
-                                    valid_rows['내부출고금액'].fillna(0)
+                        if valid_mask.any():
+                            # 거래횟수 기준 상위 5건
+                            top_5_counts = trans_counts[valid_mask].nlargest(5)
+                            top_5_rows = self.related_df.loc[top_5_counts.index]
+                            
+                            # 이름이 없으면 고객ID, 고객ID도 없으면 Unknown
+                            partner_names = pd.Series('Unknown', index=top_5_rows.index)
+                            if '관련인고객ID' in top_5_rows.columns:
+                                cust_ids = top_5_rows['관련인고객ID']
+                                partner_names = partner_names.mask(
+                                    cust_ids.notna(), '고객ID: ' + cust_ids.astype(str)
                                 )
+                            if '관련인성명' in top_5_rows.columns:
+                                names = top_5_rows['관련인성명']
+                                partner_names = names.astype(str).where(names.notna(), partner_names)
                             
-                            # 거래횟수 기준으로 정렬
-                            top_5_rows = valid_rows.nlargest(5, '거래횟수')
+                            top_5_df = pd.DataFrame({
+                                '거래횟수': top_5_counts.astype(int),
+                                '관련인성명': partner_names
+                            })
                             
-                            # TOP 5 리스트 생성
-                            top_5_list = []
-                            for idx, row in top_5_rows.iterrows():
-                                partner_info = {
-                                    '거래횟수': int(row['거래횟수'])
-                                }
-                                
-                                # 이름 찾기 - 통합 DataFrame의 실제 컬럼명 체크
-                                name_found = False
-                                # _create_unified_dataframe에서 생성되는 실제 컬럼명 사용
-                                for name_col in ['관련인성명']:  # 통합 DataFrame에서 사용하는 정확한 컬럼명
-                                    if name_col in row.index and pd.notna(row[name_col]):
-                                        partner_info['관련인성명'] = str(row[name_col])  # '관련인성명'으로 통일
-                                        name_found = True
-                                        break
-                                
-                                if not name_found:
-                                    # 이름이 없으면 고객ID 사용
-                                    if '관련인고객ID' in row.index:
-                                        # 고객ID가 있으면 사용
-                                        cust_id_value = row['관련인고객ID']
-                                        if pd.notna(cust_id_value):
-                                            partner_info['관련인성명'] = f"고객ID: {cust_id_value}"  # '관련인성명'으로 통일
-                                        else:
-                                            partner_info['관련인성명'] = "Unknown"
-                                    else:
-                                        partner_info['관련인성명'] = "Unknown"
-                                
-                                # 추가 정보 (있는 경우)
-                                if '총거래금액' in row.index:
-                                    partner_info['총거래금액'] = float(row['총거래금액'])
-                                
-                                top_5_list.append(partner_info)
+                            # 내부거래 금액 합계 (선택적)
+                            if '내부입고금액' in top_5_rows.columns and '내부출고금액' in top_5_rows.columns:
+                                top_5_df['총거래금액'] = (
+                                    pd.to_numeric(top_5_rows['내부입고금액'], errors='coerce').fillna(0) +
+                                    pd.to_numeric(top_5_rows['내부출고금액'], errors='coerce').fillna(0)
+                                ).astype(float)
                             
+                            top_5_list = top_5_df.to_dict('records')
                             analysis['related_persons_analysis']['top_5_partners'] = top_5_list
                             logger.info(f"[Stage 2] Top 5 partners: {len(top_5_list)} found")
                         else:
@@ -301,24 +287,19 @@ class CustomerProcessor:
             'dataframes': {}
         }
         
-        # DataFrame을 dict로 변환
-        if self.customer_df is not None:
-            export_data['dataframes']['customer'] = {
-                'columns': self.customer_df.columns.tolist(),
-                'rows': self.customer_df.values.tolist()
-            }
-        
-        if self.related_df is not None:
-            export_data['dataframes']['related_persons'] = {
-                'columns': self.related_df.columns.tolist(),
-                'rows': self.related_df.values.tolist()
-            }
-        
-        if self.duplicate_df is not None:
-            export_data['dataframes']['duplicate_persons'] = {
-                'columns': self.duplicate_df.columns.tolist(),
-                'rows': self.duplicate_df.values.tolist()
-            }
+        # DataFrame은 원본 행에서 변형 없이 생성되므로 원본 행을 그대로 사용
+        # (DataFrame -> ndarray -> list 재변환 생략)
+        for df, source_key, export_key in (
+            (self.customer_df, 'customer_info', 'customer'),
+            (self.related_df, 'related_persons', 'related_persons'),
+            (self.duplicate_df, 'duplicate_persons', 'duplicate_persons'),
+        ):
+            if df is not None:
+                source = execution_result[source_key]
+                export_data['dataframes'][export_key] = {
+                    'columns': list(source['columns']),
+                    'rows': source['rows']
+                }
         
         return export_data
     
@@ -326,7 +307,8 @@ class CustomerProcessor:
         """MID 반환 (다음 단계에서 사용)"""
         if self.customer_df is not None and not self.customer_df.empty:
             if 'MID' in self.customer_df.columns:
-                return str(self.customer_df.iloc[0]['MID'])
+                # 행 전체(Series) 생성 없이 단일 값만 조회
+                return str(self.customer_df['MID'].iat[0])
         return None
     
     def get_customer_type(self) -> str:
@@ -201,6 +201,7 @@ ORDER BY (ts.total_deposit_amount + ts.total_withdraw_amount) DESC
 """
 
 # ==================== 종목별 거래 상세 (DM 테이블 사용) ====================
+# {related_binds}: 관련인 고객ID 바인드 목록 (:related_0, :related_1, ...)
 PERSON_TRANSACTION_DETAIL_QUERY = """
 SELECT 
     c1_0.cntp_cust_id AS "관련인고객ID",
@@ -217,7 +218,7 @@ FROM btcamldb_own.dm_coin_tran_list c1_0
 LEFT JOIN btcamldb_own.dm_coin_base c4_0 
     ON c1_0.coin_type_cd = c4_0.coin_type_cd
 WHERE c1_0.cust_id = :cust_id
-  AND c1_0.cntp_cust_id = :related_cust_id
+  AND c1_0.cntp_cust_id IN ({related_binds})
   AND c1_0.coin_tran_dtm BETWEEN TO_TIMESTAMP(:start_date, 'YYYY-MM-DD HH24:MI:SS.FF9') 
                               AND TO_TIMESTAMP(:end_date, 'YYYY-MM-DD HH24:MI:SS.FF9')
   AND c1_0.coin_ist_rels_type_cd = 'IN'
@@ -228,6 +229,14 @@ GROUP BY
 ORDER BY "거래금액" DESC
 """
 
+# ==================== 관련인 MID 일괄 조회 ====================
+# {cust_binds}: 고객ID 바인드 목록 (:cust_0, :cust_1, ...)
+CUSTOMER_MID_QUERY = """
+SELECT CUST_ID, MEM_ID
+FROM BTCAMLDB_OWN.KYC_MEM_BASE
+WHERE CUST_ID IN ({cust_binds})
+"""
+
 # ==================== 중복 의심 회원 (바인드 변수 수정) ====================
 DUPLICATE_PERSONS_QUERY = """
 WITH DUPLICATE_CANDIDATES AS (
@@ -5,6 +5,7 @@ Stage 2 데이터를 활용한 통합 조회
 """
 
 import logging
+import re
 from typing import Dict, Any, List, Optional
 from decimal import Decimal
 
@@ -12,6 +13,9 @@ from .sql_templates import IP_ACCESS_HISTORY_QUERY
 
 logger = logging.getLogger(__name__)
 
+# 'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM:SS' 형식의 날짜 부분 매칭 (앞쪽 공백 허용)
+_DATE_RE = re.compile(r'^\s*(\d{4})-(\d{2})-(\d{2})(?:\s|$)')
+
 
 class IPAccessExecutor:
     """
@@ -154,21 +158,24 @@ class IPAccessExecutor:
         
         related_persons = []
         
+        # 컬럼 위치는 행마다 같으므로 한 번만 계산
+        col_idx = {col: i for i, col in enumerate(cols)}
+        cust_id_idx = col_idx.get('관련인고객ID')
+        name_idx = col_idx.get('관련인성명')
+        # MID 정보 - Stage 2에서 이미 조회됨 (컬럼명이 다를 수 있음)
+        mid_idx = col_idx.get('관련인MID', col_idx.get('MID'))
+        
         # Stage 2의 통합 DataFrame 구조에 따라 데이터 추출
         for row in rows:
             person = {}
             
             # 기본 정보
-            if '관련인고객ID' in cols:
-                person['cust_id'] = row[cols.index('관련인고객ID')]
-            if '관련인성명' in cols:
-                person['name'] = row[cols.index('관련인성명')]
-            
-            # MID 정보 - Stage 2에서 이미 조회됨
-            if '관련인MID' in cols:
-                person['mid'] = row[cols.index('관련인MID')]
-            elif 'MID' in cols:  # 컬럼명이 다를 수 있음
-                person['mid'] = row[cols.index('MID')]
+            if cust_id_idx is not None:
+                person['cust_id'] = row[cust_id_idx]
+            if name_idx is not None:
+                person['name'] = row[name_idx]
+            if mid_idx is not None:
+                person['mid'] = row[mid_idx]
             
             # MID가 있는 경우만 추가
             if person.get('mid'):
@@ -257,12 +264,10 @@ class IPAccessExecutor:
     
     def _extract_date(self, datetime_str: str) -> Optional[str]:
         """날짜 추출 (YYYY-MM-DD)"""
-        try:
-            if not datetime_str:
-                return None
-            date_part = str(datetime_str).split()[0]
-            if len(date_part) == 10 and date_part[4] == '-' and date_part[7] == '-':
-                return date_part
+        if not datetime_str:
+            return None
+        match = _DATE_RE.match(str(datetime_str))
+        if not match:
             return None
-        except:
-            return None
\ No newline at end of file
+        year, month, day = match.groups()
+        return f"{year}-{month}-{day}"
\ No newline at end of file
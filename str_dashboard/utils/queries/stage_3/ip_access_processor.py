@@ -10,6 +10,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# 국내 접속으로 간주하는 국가명
+DOMESTIC_COUNTRIES = frozenset({'대한민국', '한국'})
+
 
 class IPAccessProcessor:
     """
@@ -46,7 +49,7 @@ class IPAccessProcessor:
             return {
                 'success': True,
                 'dataframes': {
-                    'ip_access': self.ip_access_df,
+                    'ip_access': self._to_export_frame(),
                     'summary': self._create_summary_df(analysis)
                 },
                 'analysis': analysis,
@@ -99,31 +102,34 @@ class IPAccessProcessor:
         
         # 시간대별 분석
         if '접속일시' in self.ip_access_df.columns:
-            df = self.ip_access_df.copy()
-            df['hour'] = df['접속일시'].dt.hour
-            df['weekday'] = df['접속일시'].dt.weekday
+            access_dt = self.ip_access_df['접속일시'].dt
+            hours = access_dt.hour
             
             # 시간대별 접속
-            hour_dist = df['hour'].value_counts().to_dict()
+            hour_dist = hours.value_counts().to_dict()
             analysis['time_patterns']['by_hour'] = dict(sorted(hour_dist.items()))
             
             # 요일별 접속 (0=월요일, 6=일요일)
-            weekday_dist = df['weekday'].value_counts().to_dict()
+            weekday_dist = access_dt.weekday.value_counts().to_dict()
             analysis['time_patterns']['by_weekday'] = dict(sorted(weekday_dist.items()))
             
             # 새벽 접속 비율 (00:00 ~ 06:00)
-            dawn_access = df[df['hour'].between(0, 5)].shape[0]
-            analysis['time_patterns']['dawn_access_rate'] = round(dawn_access / len(df), 3)
+            dawn_access = int(hours.between(0, 5).sum())
+            analysis['time_patterns']['dawn_access_rate'] = round(dawn_access / len(hours), 3)
         
         # 위치 패턴 분석
         if '국가한글명' in self.ip_access_df.columns:
             country_counts = self.ip_access_df['국가한글명'].value_counts()
             analysis['location_patterns']['top_countries'] = country_counts.head(5).to_dict()
             
-            # 해외 접속 비율
-            foreign_access = self.ip_access_df[
-                self.ip_access_df['국가한글명'] != '대한민국'
-            ].shape[0]
+            # 해외 접속 비율 (국가 정보가 없는 접속은 해외로 집계하지 않음)
+            countries = self.ip_access_df['국가한글명']
+            foreign_mask = (
+                countries.notna()
+                & (countries != '')
+                & ~countries.isin(DOMESTIC_COUNTRIES)
+            )
+            foreign_access = int(foreign_mask.sum())
             analysis['location_patterns']['foreign_rate'] = round(
                 foreign_access / len(self.ip_access_df), 3
             )
@@ -261,19 +267,18 @@ class IPAccessProcessor:
             'mem_id': execution_result.get('summary', {}).get('mem_id'),
             'period': execution_result.get('summary', {}).get('period'),
             'statistics': self.statistics,
-            'analysis': analysis,
-            'dataframes': {}
+            'analysis': analysis
         }
         
-        if self.ip_access_df is not None and not self.ip_access_df.empty:
-            # datetime을 문자열로 변환
-            df_export = self.ip_access_df.copy()
-            if '접속일시' in df_export.columns:
-                df_export['접속일시'] = df_export['접속일시'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            export_data['dataframes']['ip_access'] = {
-                'columns': df_export.columns.tolist(),
-                'rows': df_export.values.tolist()
-            }
-        
-        return export_data
\ No newline at end of file
+        # 행 데이터는 행 리스트로 변환하지 않고 DataFrame 그대로 전달 (_to_export_frame)
+        return export_data
+    
+    def _to_export_frame(self) -> pd.DataFrame:
+        """
+        저장용 IP 접속 이력 DataFrame 반환
+        분석 완료 후 호출되므로 복사 없이 접속일시만 문자열로 되돌림
+        """
+        df = self.ip_access_df
+        if df is not None and not df.empty and '접속일시' in df.columns:
+            df['접속일시'] = df['접속일시'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        return df
\ No newline at end of file
@@ -3,16 +3,88 @@
 Orderbook 조회 실행 모듈
 """
 
+import hashlib
 import logging
+import threading
+import weakref
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import pandas as pd
+import psycopg2.extensions
+from django.core.cache import caches
 
 from .sql_templates import ORDERBOOK_QUERY
 from .special_range_rules import requires_extended_range
 
 logger = logging.getLogger(__name__)
 
+# Orderbook 조회 결과 캐시 유지 시간 (초)
+ORDERBOOK_CACHE_TIMEOUT = 3600
+
+# NUMERIC 컬럼을 Decimal 대신 float로 수신 (DataFrame 변환 시 object 대신 float64 컬럼)
+DECIMAL_AS_FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'DECIMAL_AS_FLOAT',
+    lambda value, cursor: float(value) if value is not None else None
+)
+
+# 행마다 반복되는 문자열 컬럼 (같은 값은 하나의 객체를 공유하도록 정리)
+REPEATED_STRING_COLUMNS = frozenset({
+    'market_nm', 'ticker_nm', 'trade_date', 'trans_from', 'trans_to', 'trans_cat'
+})
+
+# 동일 캐시 키 동시 조회 방지용 키별 잠금 (사용 중인 잠금만 유지)
+# 캐시 키에 접속 대상이 포함되므로 다른 DB/사용자 조회끼리는 서로 대기하지 않음
+_fetch_locks = weakref.WeakValueDictionary()
+_fetch_locks_guard = threading.Lock()
+
+
+def _get_fetch_lock(cache_key: str) -> threading.Lock:
+    """캐시 키별 조회 잠금 반환"""
+    with _fetch_locks_guard:
+        lock = _fetch_locks.get(cache_key)
+        if lock is None:
+            lock = threading.Lock()
+            _fetch_locks[cache_key] = lock
+        return lock
+
+
+def _to_datetime(value) -> datetime:
+    """
+    날짜 값을 datetime으로 변환
+    대부분 'YYYY-MM-DD HH:MM:SS' 형식이므로 fromisoformat으로 처리하고, 그 외 형식만 pandas 파싱
+    """
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return pd.to_datetime(value).to_pydatetime()
+
+
+def _share_repeated_strings(columns: List[str], rows: List[tuple]) -> List[tuple]:
+    """
+    반복 문자열 컬럼의 동일 값을 하나의 객체로 통일
+    메모리 사용량 감소 및 캐시 저장(pickle) 시 동일 객체는 한 번만 기록됨
+    """
+    indexes = [i for i, col in enumerate(columns) if col in REPEATED_STRING_COLUMNS]
+    if not indexes:
+        return rows
+    
+    shared = {}
+    share = shared.setdefault
+    result = []
+    for row in rows:
+        row = list(row)
+        for i in indexes:
+            value = row[i]
+            if value is not None:
+                row[i] = share(value, value)
+        result.append(tuple(row))
+    
+    logger.debug(f"[Stage 4] Shared string values: {len(shared)}")
+    return result
+
 
 class OrderbookExecutor:
     """
@@ -133,7 +205,7 @@ class OrderbookExecutor:
             
             # TRAN_END_MAX 기준 -90일, -365일 계산
             if TRAN_END_MAX:
-                end_date = pd.to_datetime(TRAN_END_MAX)
+                end_date = _to_datetime(TRAN_END_MAX)
                 TRAN_STRT_90D = (end_date - timedelta(days=90)).strftime('%Y-%m-%d %H:%M:%S')
                 TRAN_STRT_365D = (end_date - timedelta(days=365)).strftime('%Y-%m-%d %H:%M:%S')
             else:
@@ -213,7 +285,7 @@ class OrderbookExecutor:
         # 가장 오래된 날짜 선택
         if dates_to_compare:
             # 날짜를 datetime으로 변환하여 비교
-            datetime_list = [pd.to_datetime(d) for d in dates_to_compare]
+            datetime_list = [_to_datetime(d) for d in dates_to_compare]
             oldest_date = min(datetime_list)
             return oldest_date.strftime('%Y-%m-%d %H:%M:%S')
         
@@ -249,16 +321,51 @@ class OrderbookExecutor:
         
         return mid_list
         
+    def _build_cache_key(self, start_date: str, end_date: str, mid_list: List[str]) -> str:
+        """
+        접속 대상, 조회 기간, MID 목록으로 캐시 키 생성 (MID 순서 무관)
+        접속 대상(호스트/포트/DB/사용자)이 다르면 같은 기간/MID라도 결과를 공유하지 않음
+        """
+        conn_digest = hashlib.sha1(self.rs_conn.identity.encode('utf-8')).hexdigest()
+        mid_digest = hashlib.sha1(','.join(sorted(mid_list)).encode('utf-8')).hexdigest()
+        return f"orderbook:{conn_digest}:{start_date}:{end_date}:{mid_digest}"
+    
     def _query_orderbook(self, start_date: str, end_date: str, 
                         mid_list: List[str]) -> Dict[str, Any]:
-        """Orderbook 조회"""
+        """Orderbook 조회 (동일 기간/MID 조합은 캐시 재사용)"""
+        cache = caches['orderbook']
+        cache_key = self._build_cache_key(start_date, end_date, mid_list)
+        
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[Stage 4] Orderbook cache hit - {len(cached['rows'])} records")
+            return cached
+        
+        # 같은 접속 대상/기간/MID를 동시에 조회하는 경우 한 스레드만 Redshift를 조회하고
+        # 나머지는 캐시 결과 사용 (잠금도 접속 대상이 포함된 캐시 키 단위)
+        with _get_fetch_lock(cache_key):
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"[Stage 4] Orderbook cache hit after wait - {len(cached['rows'])} records")
+                return cached
+            
+            result = self._fetch_orderbook(start_date, end_date, mid_list)
+            if result['success']:
+                cache.set(cache_key, result, ORDERBOOK_CACHE_TIMEOUT)
+            return result
+    
+    def _fetch_orderbook(self, start_date: str, end_date: str, 
+                         mid_list: List[str]) -> Dict[str, Any]:
+        """Redshift에서 Orderbook 조회"""
         try:
-            # 날짜를 pandas datetime으로 변환
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
+            # 날짜를 datetime으로 변환 ('YYYY-MM-DD HH:MM:SS' 형식은 pandas 파싱 생략)
+            start_dt = _to_datetime(start_date)
+            end_dt = _to_datetime(end_date)
             
             with self.rs_conn.transaction() as conn:
                 with conn.cursor() as cursor:
+                    psycopg2.extensions.register_type(DECIMAL_AS_FLOAT, cursor)
+                    
                     # MID 리스트 처리 - 각각 별도 파라미터로
                     if len(mid_list) == 1:
                         # 단일 MID
@@ -316,7 +423,7 @@ class OrderbookExecutor:
                         return {'success': True, 'columns': [], 'rows': []}
                     
                     cols = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
+                    rows = _share_repeated_strings(cols, cursor.fetchall())
                     
                     logger.info(f"[Stage 4] Orderbook query found {len(rows)} records")
                     
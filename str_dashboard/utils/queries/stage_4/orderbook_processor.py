@@ -9,6 +9,12 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Orderbook 쿼리의 trade_date 출력 형식 (TO_CHAR(trade_date, 'YYYY-MM-DD'))
+TRADE_DATE_FORMAT = '%Y-%m-%d'
+
+# 값 종류가 적은 문자열 컬럼 (category로 보관)
+CATEGORY_COLUMNS = ('market_nm', 'ticker_nm', 'trans_from', 'trans_to', 'trans_cat')
+
 
 class OrderbookProcessor:
     """
@@ -39,7 +45,7 @@ class OrderbookProcessor:
             return {
                 'success': True,
                 'dataframes': {
-                    'orderbook': self.orderbook_df
+                    'orderbook': self._to_export_frame()
                 },
                 'analysis': analysis,
                 'export_data': export_data
@@ -57,24 +63,47 @@ class OrderbookProcessor:
         orderbook_data = execution_result.get('orderbook_data', {})
         
         if orderbook_data.get('columns') and orderbook_data.get('rows'):
+            columns = orderbook_data['columns']
+            # 행 튜플을 컬럼 단위로 전치하여 생성 (2차원 object 배열을 거치지 않고 컬럼별 dtype 추론)
             self.orderbook_df = pd.DataFrame(
-                orderbook_data['rows'],
-                columns=orderbook_data['columns']
+                dict(zip(columns, zip(*orderbook_data['rows']))),
+                columns=columns
             )
             
-            # trade_date를 datetime으로 변환
+            # trade_date를 datetime으로 변환 (쿼리에서 'YYYY-MM-DD'로 고정 출력)
             if 'trade_date' in self.orderbook_df.columns:
                 self.orderbook_df['trade_date'] = pd.to_datetime(
                     self.orderbook_df['trade_date'],
+                    format=TRADE_DATE_FORMAT,
                     errors='coerce'
                 )
             
+            self._compact_dtypes()
+            
             logger.info(f"[Stage 4 Processor] Orderbook DF: {self.orderbook_df.shape}")
         else:
             self.orderbook_df = pd.DataFrame()
         
         self.metadata = execution_result.get('metadata', {})
     
+    def _compact_dtypes(self):
+        """
+        메모리 절감을 위한 dtype 축소
+        - 반복 문자열 컬럼: category
+        - 정수 컬럼: 최소 정수 타입
+        (금액/가격 float 컬럼은 정밀도 유지를 위해 float64 유지)
+        """
+        df = self.orderbook_df
+        
+        # pandas 3부터 문자열 컬럼 기본 dtype이 object가 아닌 str이므로 두 경우 모두 확인
+        for col in CATEGORY_COLUMNS:
+            if col in df.columns and (pd.api.types.is_object_dtype(df[col])
+                                      or pd.api.types.is_string_dtype(df[col])):
+                df[col] = df[col].astype('category')
+        
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    
     def _analyze_orderbook(self) -> Dict[str, Any]:
         """Orderbook 데이터 분석"""
         if self.orderbook_df is None or self.orderbook_df.empty:
@@ -93,7 +122,7 @@ class OrderbookProcessor:
         }
         
         # 사용자별 집계
-        user_summary = self.orderbook_df.groupby('user_id').agg({
+        user_summary = self.orderbook_df.groupby('user_id', observed=True).agg({
             'trade_amount_krw': ['sum', 'mean', 'count'],
             'ticker_nm': 'nunique'
         }).to_dict()
@@ -101,7 +130,7 @@ class OrderbookProcessor:
         analysis['user_summary'] = user_summary
         
         # 종목별 거래 요약
-        ticker_summary = self.orderbook_df.groupby('ticker_nm')['trade_amount_krw'].sum().nlargest(10).to_dict()
+        ticker_summary = self.orderbook_df.groupby('ticker_nm', observed=True)['trade_amount_krw'].sum().nlargest(10).to_dict()
         analysis['top_10_tickers'] = ticker_summary
         
         return analysis
@@ -109,23 +138,19 @@ class OrderbookProcessor:
     def _prepare_export_data(self, execution_result: Dict[str, Any],
                            analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Export용 데이터 준비"""
-        export_data = {
+        # 행 데이터는 행 리스트로 변환하지 않고 DataFrame 그대로 전달 (_to_export_frame)
+        return {
             'stage': 'stage_4',
             'metadata': self.metadata,
-            'analysis': analysis,
-            'dataframes': {}
+            'analysis': analysis
         }
-        
-        if self.orderbook_df is not None and not self.orderbook_df.empty:
-            df_export = self.orderbook_df.copy()
-            
-            # datetime을 문자열로 변환
-            if 'trade_date' in df_export.columns:
-                df_export['trade_date'] = df_export['trade_date'].dt.strftime('%Y-%m-%d')
-            
-            export_data['dataframes']['orderbook'] = {
-                'columns': df_export.columns.tolist(),
-                'rows': df_export.values.tolist()
-            }
-        
-        return export_data
\ No newline at end of file
+    
+    def _to_export_frame(self) -> pd.DataFrame:
+        """
+        저장용 Orderbook DataFrame 반환
+        분석 완료 후 호출되므로 복사 없이 trade_date만 문자열로 되돌림
+        """
+        df = self.orderbook_df
+        if df is not None and not df.empty and 'trade_date' in df.columns:
+            df['trade_date'] = df['trade_date'].dt.strftime(TRADE_DATE_FORMAT)
+        return df
\ No newline at end of file
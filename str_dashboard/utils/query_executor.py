@@ -5,11 +5,8 @@ Stage 기반 쿼리 실행 모듈
 """
 
 import logging
-from typing import Dict, Any, Optional
-from pathlib import Path
-from django.conf import settings
+from typing import Dict, Any
 
-from .db import RedshiftConnection
 from .queries.stage_1 import AlertInfoExecutor, AlertInfoProcessor
 from .queries.stage_2 import CustomerExecutor, CustomerProcessor
 
@@ -22,13 +19,16 @@ class QueryExecutor:
     def __init__(self):
         self.stage_results = {}
         
-    def execute_stage_1(self, db_conn, alert_id: str) -> Dict[str, Any]:
+    def execute_stage_1(self, db_conn, alert_id: str, cache_scope: str = '') -> Dict[str, Any]:
         """
         Stage 1: ALERT 정보 조회
+        
+        Args:
+            cache_scope: Oracle 접속 식별 문자열 (Rule 히스토리 캐시 구분용)
         """
         try:
             # Stage 1 Executor 실행
-            executor = AlertInfoExecutor(db_conn)
+            executor = AlertInfoExecutor(db_conn, cache_scope)
             execution_result = executor.execute(alert_id)
             
             if not execution_result['success']:
@@ -107,40 +107,6 @@ class QueryExecutor:
                 'message': f"고객 정보 조회 실패: {str(e)}"
             }
     
-    def execute_orderbook_query(self, redshift_info: Dict, mem_id: str, 
-                               start_date: str, end_date: str) -> Dict[str, Any]:
-        """
-        Redshift Orderbook 조회 (Stage 4에서 사용 예정)
-        """
-        try:
-            redshift_conn = RedshiftConnection.from_session(redshift_info)
-            
-            # SQL 파일 경로 (추후 stage_4로 이동 예정)
-            sql_path = Path(settings.BASE_DIR) / 'str_dashboard' / 'queries' / 'redshift_orderbook.sql'
-            
-            if not sql_path.exists():
-                logger.warning("Orderbook SQL file not found, using empty result")
-                return {'success': True, 'columns': [], 'rows': []}
-            
-            sql_query = sql_path.read_text('utf-8')
-            
-            with redshift_conn.transaction() as rs_conn:
-                with rs_conn.cursor() as cursor:
-                    cursor.execute(sql_query, (start_date, end_date, mem_id))
-                    
-                    if not cursor.description:
-                        return {'success': True, 'columns': [], 'rows': []}
-                    
-                    cols = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    
-                    return {'success': True, 'columns': cols, 'rows': rows}
-                    
-        except Exception as e:
-            logger.error(f"Orderbook query failed: {e}")
-            # Redshift 실패는 크리티컬하지 않으므로 빈 결과 반환
-            return {'success': True, 'columns': [], 'rows': []}
-    
     def get_stage_results(self) -> Dict[str, Any]:
         """모든 Stage 결과 반환"""
         return self.stage_results
\ No newline at end of file
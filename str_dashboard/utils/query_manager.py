@@ -5,6 +5,7 @@ Stage 기반 실행을 중앙에서 관리
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from decimal import Decimal
 
@@ -38,7 +39,7 @@ class QueryManager:
                 logger.info(f"Starting integrated query for ALERT ID: {alert_id}")
                 
                 # Stage 1: ALERT 정보 조회
-                stage_1_result = self._execute_stage_1(db_conn, alert_id)
+                stage_1_result = self._execute_stage_1(db_conn, alert_id, oracle_conn.identity)
                 if not stage_1_result['success']:
                     return stage_1_result
                 
@@ -55,16 +56,28 @@ class QueryManager:
                 if not stage_2_result['success']:
                     return stage_2_result
                 
-                # Stage 3: IP/거래 이력 (필요시)
                 mid = stage_2_result['metadata'].get('mid')
                 customer_type = stage_2_result['metadata'].get('customer_type')
                 
-                if mid and customer_type == 'PERSON':
-                    self._execute_stage_3(db_conn, cust_id, mid)
-                
-                # Stage 4: Orderbook (Redshift - 옵션)
-                if self.redshift_info and mid:
-                    self._execute_stage_4(mid)
+                # Stage 3(Oracle)과 Stage 4(Redshift)는 서로 독립적이므로
+                # Redshift 조회를 별도 스레드에서 먼저 시작하고 Stage 3를 진행
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix='stage4') as pool:
+                    stage_4_future = None
+                    if self.redshift_info and mid:
+                        stage_4_future = pool.submit(
+                            self._fetch_stage_4,
+                            self.df_manager.metadata.get('stage_1', {}),
+                            self.df_manager.metadata.get('stage_2', {})
+                        )
+                    
+                    # Stage 3: IP/거래 이력 (필요시)
+                    if mid and customer_type == 'PERSON':
+                        self._execute_stage_3(db_conn, cust_id, mid)
+                    
+                    # Stage 4: Orderbook (Redshift - 옵션)
+                    if stage_4_future is not None:
+                        self._store_stage_4(stage_4_future.result())
+                        stage_4_future = None  # 처리 결과 참조 해제
                 
                 # 최종 결과 정리
                 summary = self.df_manager.get_all_datasets_summary()
@@ -87,9 +100,9 @@ class QueryManager:
                 'message': str(e)
             }
     
-    def _execute_stage_1(self, db_conn, alert_id: str) -> Dict[str, Any]:
+    def _execute_stage_1(self, db_conn, alert_id: str, cache_scope: str) -> Dict[str, Any]:
         """Stage 1 실행 및 DataFrame 저장"""
-        result = self.executor.execute_stage_1(db_conn, alert_id)
+        result = self.executor.execute_stage_1(db_conn, alert_id, cache_scope)
         
         if result['success']:
             # DataFrame Manager에 저장
@@ -169,20 +182,19 @@ class QueryManager:
             processed_result = processor.process(execution_result)
             
             if processed_result['success']:
-                # IP 접속 데이터 저장
-                ip_data = processed_result.get('export_data', {}).get('dataframes', {}).get('ip_access', {})
-                if ip_data.get('columns') and ip_data.get('rows'):
-                    self.df_manager.add_dataset(
+                # IP 접속 데이터 저장 (Processor의 DataFrame을 행 리스트로 변환하지 않고 그대로 보관)
+                ip_df = processed_result.get('dataframes', {}).get('ip_access')
+                if ip_df is not None and not ip_df.empty:
+                    self.df_manager.add_dataframe(
                         'ip_access_history',
-                        ip_data['columns'],
-                        ip_data['rows'],
+                        ip_df,
                         **processed_result.get('export_data', {}).get('metadata', {})
                     )
                     logger.info(f"Stage 3 completed: IP access history saved")
                 
-                # 메타데이터 업데이트
+                # 메타데이터 업데이트 (행 데이터는 데이터셋으로 저장됨)
                 if 'export_data' in processed_result:
-                    self.df_manager.metadata['stage_3'] = processed_result['export_data']
+                    self.df_manager.metadata['stage_3'] = self._without_rows(processed_result['export_data'])
             
             return processed_result
             
@@ -193,21 +205,17 @@ class QueryManager:
     
 
 
-    def _execute_stage_4(self, mid: str):
-        """Stage 4: Orderbook 조회"""
+    def _fetch_stage_4(self, stage_1_data: Dict[str, Any],
+                       stage_2_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Stage 4: Orderbook 조회 및 가공
+        작업 스레드에서 실행되므로 df_manager는 변경하지 않음
+        """
         try:
             from .queries.stage_4 import OrderbookExecutor, OrderbookProcessor
-            
-            if not self.redshift_info:
-                logger.info("Redshift not connected, skipping Stage 4")
-                return
-            
-            # Stage 1, 2 데이터 가져오기
-            stage_1_data = self.df_manager.metadata.get('stage_1', {})
-            stage_2_data = self.df_manager.metadata.get('stage_2', {})
+            from .db import RedshiftConnection
             
             # Redshift 연결
-            from .db import RedshiftConnection
             rs_conn = RedshiftConnection.from_session(self.redshift_info)
             
             # Stage 4 Executor 실행
@@ -216,33 +224,43 @@ class QueryManager:
             
             if not execution_result['success']:
                 logger.warning(f"Stage 4 failed: {execution_result.get('message')}")
-                return
+                return None
             
             # Stage 4 Processor 처리
             processor = OrderbookProcessor()
-            processed_result = processor.process(execution_result)
+            return processor.process(execution_result)
             
-            if processed_result['success']:
-                # Orderbook 데이터 저장
-                orderbook_data = processed_result.get('export_data', {}).get('dataframes', {}).get('orderbook', {})
-                if orderbook_data.get('columns') and orderbook_data.get('rows'):
-                    self.df_manager.add_dataset(
-                        'orderbook',
-                        orderbook_data['columns'],
-                        orderbook_data['rows'],
-                        **processed_result.get('export_data', {}).get('metadata', {})
-                    )
-                    logger.info(f"Stage 4 completed: Orderbook data saved")
-                
-                # 메타데이터 업데이트
-                if 'export_data' in processed_result:
-                    self.df_manager.metadata['stage_4'] = processed_result['export_data']
-                    
         except Exception as e:
             logger.error(f"Stage 4 (Orderbook) failed: {e}")
-            # Orderbook은 옵션이므로 실패해도 계속 진행    
-
-
+            # Orderbook은 옵션이므로 실패해도 계속 진행
+            return None
+    
+    def _store_stage_4(self, processed_result: Optional[Dict[str, Any]]):
+        """Stage 4 결과를 DataFrame Manager에 저장"""
+        if not processed_result or not processed_result.get('success'):
+            return
+        
+        # Orderbook 데이터 저장 (Processor의 DataFrame을 행 리스트로 변환하지 않고 그대로 보관)
+        orderbook_df = processed_result.get('dataframes', {}).get('orderbook')
+        if orderbook_df is not None and not orderbook_df.empty:
+            self.df_manager.add_dataframe(
+                'orderbook',
+                orderbook_df,
+                **processed_result.get('export_data', {}).get('metadata', {})
+            )
+            logger.info(f"Stage 4 completed: Orderbook data saved")
+        
+        # 메타데이터 업데이트 (행 데이터는 데이터셋으로 저장됨)
+        if 'export_data' in processed_result:
+            self.df_manager.metadata['stage_4'] = self._without_rows(processed_result['export_data'])
+    
+    @staticmethod
+    def _without_rows(export_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        데이터셋으로 이미 저장된 행 데이터(dataframes)를 제외한 Stage 메타데이터
+        이후 Stage에서 참조하지 않으므로 세션 데이터에 중복 보관하지 않음
+        """
+        return {key: value for key, value in export_data.items() if key != 'dataframes'}
 
     def _prepare_export_data(self) -> Dict[str, Any]:
         """DataFrame Manager 데이터를 export 형식으로 변환"""
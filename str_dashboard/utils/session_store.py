@@ -0,0 +1,169 @@
+# str_dashboard/utils/session_store.py
+"""
+세션 외부 데이터 저장 모듈
+대용량 조회 결과는 캐시에 보관하고 세션에는 조회용 키만 저장
+
+DB 접속 정보(비밀번호 포함) 슬롯은 SECRET_KEY에서 유도한 키로 암호화(Fernet)하여 저장
+- default 캐시(DB 테이블)는 세션 테이블과 같은 DB에 있으므로 평문 사본을 남기지 않기 위함
+- SECRET_KEY가 바뀌면 기존 항목은 복호화되지 않고 만료로 처리 (재연결 필요)
+"""
+
+import base64
+import hashlib
+import logging
+import pickle
+import uuid
+import zlib
+from functools import lru_cache
+from typing import Any, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+
+logger = logging.getLogger(__name__)
+
+# 캐시 보관 시간 (초)
+SESSION_DATA_TIMEOUT = 3600
+
+# 압축 저장 시 zlib 레벨 (속도 우선)
+COMPRESS_LEVEL = 1
+
+# 대용량 슬롯별 캐시 (그 외 슬롯은 default 캐시)
+# 통합 조회 결과/TOML은 파일 캐시에 보관하여 워커 간 공유하고 워커 메모리에 두지 않음
+SLOT_CACHE_ALIASES = {
+    'df_manager_data': 'results',
+    'toml_export': 'results',
+}
+
+# 암호화하여 저장하는 슬롯 (DB 접속 정보)
+ENCRYPTED_SLOTS = frozenset({'db_conn', 'rs_conn'})
+
+
+class _CompressedValue:
+    """압축 저장된 값 (조회 시 자동 복원)"""
+    __slots__ = ('payload',)
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+
+    def __getstate__(self):
+        return self.payload
+
+    def __setstate__(self, state):
+        self.payload = state
+
+
+class _EncryptedValue:
+    """암호화 저장된 값 (조회 시 자동 복호화)"""
+    __slots__ = ('token',)
+
+    def __init__(self, token: bytes):
+        self.token = token
+
+    def __getstate__(self):
+        return self.token
+
+    def __setstate__(self, state):
+        self.token = state
+
+
+@lru_cache(maxsize=1)
+def _fernet(secret_key: str) -> Fernet:
+    """SECRET_KEY에서 유도한 암호화 키"""
+    digest = hashlib.sha256(f"str_dashboard.session_store:{secret_key}".encode('utf-8')).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def _handle_name(slot: str) -> str:
+    """세션에 저장되는 키 이름"""
+    return f"{slot}_key"
+
+
+def _cache_for(slot: str):
+    """슬롯 데이터를 보관하는 캐시"""
+    return caches[SLOT_CACHE_ALIASES.get(slot, 'default')]
+
+
+def store_session_data(request, slot: str, value: Any,
+                       timeout: int = SESSION_DATA_TIMEOUT,
+                       compress: bool = False) -> str:
+    """
+    데이터를 캐시에 저장하고 세션에는 캐시 키만 기록
+
+    Args:
+        request: Django request
+        slot: 데이터 구분 이름 (예: 'df_manager_data')
+        value: 저장할 데이터
+        timeout: 캐시 유지 시간 (초)
+        compress: 대용량 데이터 압축 저장 여부
+                  (파일 캐시는 저장 시 자체적으로 zlib 압축하므로 중복 압축하지 않음)
+
+    Returns:
+        캐시 키
+    """
+    # 이전 데이터 정리
+    clear_session_data(request, slot)
+
+    target_cache = _cache_for(slot)
+    if isinstance(target_cache, FileBasedCache):
+        compress = False
+
+    if slot in ENCRYPTED_SLOTS:
+        token = _fernet(settings.SECRET_KEY).encrypt(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        value = _EncryptedValue(token)
+    elif compress:
+        payload = zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), COMPRESS_LEVEL)
+        logger.debug(f"Session data compressed: {slot} ({len(payload):,} bytes)")
+        value = _CompressedValue(payload)
+
+    cache_key = f"{slot}:{uuid.uuid4().hex}"
+    target_cache.set(cache_key, value, timeout)
+    request.session[_handle_name(slot)] = cache_key
+
+    logger.debug(f"Session data stored: {slot} -> {cache_key}")
+    return cache_key
+
+
+def load_session_data(request, slot: str, default: Any = None) -> Any:
+    """세션의 캐시 키로 데이터 조회 (만료 시 default 반환)"""
+    cache_key = request.session.get(_handle_name(slot))
+    if not cache_key:
+        return default
+
+    value = _cache_for(slot).get(cache_key)
+    if value is None:
+        logger.info(f"Session data expired: {slot}")
+        return default
+
+    if isinstance(value, _EncryptedValue):
+        try:
+            return pickle.loads(_fernet(settings.SECRET_KEY).decrypt(value.token))
+        except InvalidToken:
+            logger.warning(f"Session data could not be decrypted: {slot}")
+            return default
+    if isinstance(value, _CompressedValue):
+        return pickle.loads(zlib.decompress(value.payload))
+    return value
+
+
+def get_session_data_key(request, slot: str) -> Optional[str]:
+    """현재 세션에 기록된 캐시 키 반환"""
+    return request.session.get(_handle_name(slot))
+
+
+def has_session_data(request, slot: str) -> bool:
+    """세션의 캐시 키에 해당하는 데이터가 아직 남아있는지 확인 (값은 읽지 않음)"""
+    cache_key = request.session.get(_handle_name(slot))
+    return bool(cache_key) and _cache_for(slot).has_key(cache_key)
+
+
+def clear_session_data(request, slot: str):
+    """캐시 데이터와 세션 키 삭제"""
+    cache_key = request.session.pop(_handle_name(slot), None)
+    if cache_key:
+        _cache_for(slot).delete(cache_key)
+
+    # 이전 방식(세션 직접 저장)으로 남아있는 데이터 정리
+    request.session.pop(slot, None)
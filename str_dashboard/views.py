@@ -1,24 +1,163 @@
 # str_dashboard/views.py
 
+import codecs
+import hashlib
 import logging
-import json
-import tempfile
-from pathlib import Path
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from datetime import datetime, date
+
+import orjson
 
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse, HttpResponse, FileResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.http import content_disposition_header
 from django.views.decorators.http import require_POST
 
 # 내부 모듈 import
 from .utils.query_manager import QueryManager
 from .utils.df_manager import DataFrameManager
 from .utils.db import OracleConnection, RedshiftConnection, DEFAULT_CONFIG
+from .utils.session_store import (
+    store_session_data, load_session_data, clear_session_data, get_session_data_key,
+    has_session_data
+)
 from .toml import toml_collector, toml_exporter
 
 logger = logging.getLogger(__name__)
 
+# 연결 테스트 필수 입력 필드
+ORACLE_CONN_FIELDS = ('host', 'port', 'service_name', 'username', 'password')
+REDSHIFT_CONN_FIELDS = ('host', 'port', 'dbname', 'username', 'password')
+
+# 연결 요청 본문 최대 크기 (바이트) - 초과 시 본문 파싱/드라이버 호출 없이 거부
+CONN_REQUEST_MAX_BYTES = 4096
+
+# save_to_session으로 저장되는 화면 상태 값의 세션 슬롯 접두어
+UI_STATE_SLOT_PREFIX = 'ui_state:'
+
+# 복원된 DataFrameManager 프로세스 내 보관 개수 / 보관 시간(초)
+DF_MANAGER_MEMO_SIZE = 2
+DF_MANAGER_MEMO_TTL = 120
+
+# CSV 내보내기 시 한 번에 변환하는 행 수
+CSV_CHUNK_ROWS = 10000
+
+# 같은 접속 정보로 성공한 연결 테스트 결과 재사용 시간 (초)
+CONN_TEST_REUSE_SECONDS = 60
+
+# 동일 통합 조회 진행 중일 때 결과 대기 최대 시간 (초)
+INFLIGHT_QUERY_TIMEOUT = 600
+
+# 같은 ALERT ID 재조회 시 직전 결과 재사용 시간 (초)
+REPEAT_QUERY_REUSE_SECONDS = 60
+
+# ALERT ID 조회 페이지 고정 컨텍스트 (메뉴 및 기본 연결 정보)
+MENU1_1_STATIC_CONTEXT = {
+    'active_top_menu': 'menu1',
+    'active_sub_menu': 'menu1_1',
+    'default_host': DEFAULT_CONFIG['ORACLE']['HOST'],
+    'default_port': DEFAULT_CONFIG['ORACLE']['PORT'],
+    'default_service': DEFAULT_CONFIG['ORACLE']['SERVICE'],
+    'default_username': DEFAULT_CONFIG['ORACLE']['USERNAME'],
+    'default_rs_host': DEFAULT_CONFIG['REDSHIFT']['HOST'],
+    'default_rs_port': DEFAULT_CONFIG['REDSHIFT']['PORT'],
+    'default_rs_dbname': DEFAULT_CONFIG['REDSHIFT']['DBNAME'],
+    'default_rs_username': DEFAULT_CONFIG['REDSHIFT']['USERNAME'],
+}
+
+
+# ==================== JSON 응답 헬퍼 ====================
+
+def _orjson_default(obj):
+    """orjson이 기본 지원하지 않는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJsonResponse(HttpResponse):
+    """
+    orjson 기반 JSON 응답
+    numpy 타입, Decimal, 날짜, 숫자 키를 그대로 처리
+    """
+    
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(
+            orjson.dumps(
+                data,
+                default=_orjson_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ),
+            **kwargs
+        )
+
+
+# ==================== DataFrame Manager 복원 ====================
+
+# 캐시 키 → (복원된 DataFrameManager, 복원 시각)
+# 조회마다 새 캐시 키가 발급되므로 키가 같으면 내용도 동일
+# 워커 메모리를 오래 점유하지 않도록 개수와 보관 시간(DF_MANAGER_MEMO_TTL)을 모두 제한
+_df_manager_memo: 'OrderedDict[str, tuple]' = OrderedDict()
+_df_manager_memo_lock = threading.Lock()
+
+
+def _prune_df_manager_memo(now: float):
+    """보관 시간이 지난 항목 제거 (호출 측에서 lock 보유)"""
+    expired = [key for key, (_, created_at) in _df_manager_memo.items()
+               if now - created_at >= DF_MANAGER_MEMO_TTL]
+    for key in expired:
+        del _df_manager_memo[key]
+
+
+def _load_df_manager(request):
+    """
+    세션의 조회 결과로 DataFrameManager 복원
+    같은 결과에 대한 반복 요청(CSV, 상태 조회 등)은 복원 결과를 재사용 (읽기 전용으로 사용)
+    
+    Returns:
+        DataFrameManager 또는 None (데이터 없음/만료)
+    """
+    cache_key = get_session_data_key(request, 'df_manager_data')
+    if not cache_key:
+        return None
+    
+    with _df_manager_memo_lock:
+        _prune_df_manager_memo(time.time())
+        entry = _df_manager_memo.get(cache_key)
+        df_manager = entry[0] if entry else None
+        if df_manager is not None:
+            _df_manager_memo.move_to_end(cache_key)
+    
+    # 원본 캐시가 만료되었으면 재사용하지 않음
+    if df_manager is not None:
+        if has_session_data(request, 'df_manager_data'):
+            return df_manager
+        with _df_manager_memo_lock:
+            _df_manager_memo.pop(cache_key, None)
+        return None
+    
+    df_manager_data = load_session_data(request, 'df_manager_data')
+    if not df_manager_data:
+        return None
+    
+    df_manager = DataFrameManager.from_dict(df_manager_data)
+    
+    with _df_manager_memo_lock:
+        _df_manager_memo[cache_key] = (df_manager, time.time())
+        while len(_df_manager_memo) > DF_MANAGER_MEMO_SIZE:
+            _df_manager_memo.popitem(last=False)
+    
+    return df_manager
+
+
 # ==================== 페이지 뷰 ====================
 
 @login_required
@@ -31,40 +170,65 @@ def home(request):
 def menu1_1(request):
     """ALERT ID 조회 페이지"""
     context = {
-        'active_top_menu': 'menu1',
-        'active_sub_menu': 'menu1_1',
+        **MENU1_1_STATIC_CONTEXT,
         'db_status': request.session.get('db_conn_status', 'need'),
         'rs_status': request.session.get('rs_conn_status', 'need'),
-        # 기본 연결 정보
-        'default_host': DEFAULT_CONFIG['ORACLE']['HOST'],
-        'default_port': DEFAULT_CONFIG['ORACLE']['PORT'],
-        'default_service': DEFAULT_CONFIG['ORACLE']['SERVICE'],
-        'default_username': DEFAULT_CONFIG['ORACLE']['USERNAME'],
-        'default_rs_host': DEFAULT_CONFIG['REDSHIFT']['HOST'],
-        'default_rs_port': DEFAULT_CONFIG['REDSHIFT']['PORT'],
-        'default_rs_dbname': DEFAULT_CONFIG['REDSHIFT']['DBNAME'],
-        'default_rs_username': DEFAULT_CONFIG['REDSHIFT']['USERNAME'],
     }
     return render(request, 'str_dashboard/menu1_1/main.html', context)
 
 
 # ==================== 데이터베이스 연결 API ====================
 
+def _conn_request_too_large(request) -> bool:
+    """연결 요청 본문이 CONN_REQUEST_MAX_BYTES를 넘는지 Content-Length로 확인 (본문은 읽지 않음)"""
+    try:
+        return int(request.META.get('CONTENT_LENGTH') or 0) > CONN_REQUEST_MAX_BYTES
+    except ValueError:
+        return True
+
+
+def _conn_request_rejected() -> ORJsonResponse:
+    """크기 초과 연결 요청 응답"""
+    return ORJsonResponse({
+        'success': False,
+        'message': '요청 데이터가 너무 큽니다.'
+    }, status=400)
+
+
+def _extract_params(post, fields: tuple, prefix: str = '') -> dict:
+    """POST에서 접속 정보 필드 추출 (앞뒤 공백 제거, 없는 필드는 빈 문자열)"""
+    return {field: post.get(f'{prefix}{field}', '').strip() for field in fields}
+
+
+def _recently_verified(request, slot: str, conn_details: dict) -> bool:
+    """같은 접속 정보로 최근(CONN_TEST_REUSE_SECONDS 이내) 연결 테스트에 성공했는지 확인"""
+    session = request.session
+    return (
+        session.get(f'{slot}_status') == 'ok'
+        and time.time() - session.get(f'{slot}_verified_at', 0) < CONN_TEST_REUSE_SECONDS
+        and load_session_data(request, slot) == conn_details
+    )
+
+
+def _mark_verified(request, slot: str, conn_details: dict):
+    """연결 테스트 성공 기록 (접속 정보는 캐시, 상태/시각은 세션)"""
+    request.session[f'{slot}_status'] = 'ok'
+    request.session[f'{slot}_verified_at'] = time.time()
+    store_session_data(request, slot, conn_details)
+
+
 @require_POST
 @login_required
 def test_oracle_connection(request):
     """Oracle 데이터베이스 연결 테스트"""
+    if _conn_request_too_large(request):
+        return _conn_request_rejected()
+    
     try:
-        params = {
-            'host': request.POST.get('host', '').strip(),
-            'port': request.POST.get('port', '').strip(),
-            'service_name': request.POST.get('service_name', '').strip(),
-            'username': request.POST.get('username', '').strip(),
-            'password': request.POST.get('password', '').strip()
-        }
+        params = _extract_params(request.POST, ORACLE_CONN_FIELDS)
         
         if not all(params.values()):
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'message': '모든 필드를 입력해주세요.'
             })
@@ -79,26 +243,32 @@ def test_oracle_connection(request):
             'password': params['password']
         }
         
+        if _recently_verified(request, 'db_conn', conn_details):
+            logger.info("Oracle connection recently verified - skipping test")
+            return ORJsonResponse({
+                'success': True,
+                'message': 'Oracle 연결에 성공했습니다.'
+            })
+        
         oracle_conn = OracleConnection(**conn_details)
         
         if oracle_conn.test_connection():
-            request.session['db_conn_status'] = 'ok'
-            request.session['db_conn'] = conn_details
+            _mark_verified(request, 'db_conn', conn_details)
             logger.info("Oracle connection successful")
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': True,
                 'message': 'Oracle 연결에 성공했습니다.'
             })
         else:
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'message': 'Oracle 연결 테스트 실패'
             })
             
     except Exception as e:
-        logger.error(f"Oracle connection test failed: {e}")
+        logger.error("Oracle connection test failed: %s", e)
         request.session['db_conn_status'] = 'need'
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'message': f'연결 오류: {str(e)}'
         })
@@ -108,41 +278,44 @@ def test_oracle_connection(request):
 @login_required
 def test_redshift_connection(request):
     """Redshift 데이터베이스 연결 테스트"""
+    if _conn_request_too_large(request):
+        return _conn_request_rejected()
+    
     try:
-        params = {
-            'host': request.POST.get('host', '').strip(),
-            'port': request.POST.get('port', '').strip(),
-            'dbname': request.POST.get('dbname', '').strip(),
-            'username': request.POST.get('username', '').strip(),
-            'password': request.POST.get('password', '').strip()
-        }
+        params = _extract_params(request.POST, REDSHIFT_CONN_FIELDS)
         
         if not all(params.values()):
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'message': '모든 필드를 입력해주세요.'
             })
         
+        if _recently_verified(request, 'rs_conn', params):
+            logger.info("Redshift connection recently verified - skipping test")
+            return ORJsonResponse({
+                'success': True,
+                'message': 'Redshift 연결에 성공했습니다.'
+            })
+        
         redshift_conn = RedshiftConnection(**params)
         
         if redshift_conn.test_connection():
-            request.session['rs_conn_status'] = 'ok'
-            request.session['rs_conn'] = params
+            _mark_verified(request, 'rs_conn', params)
             logger.info("Redshift connection successful")
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': True,
                 'message': 'Redshift 연결에 성공했습니다.'
             })
         else:
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'message': 'Redshift 연결 테스트 실패'
             })
             
     except Exception as e:
-        logger.error(f"Redshift connection test failed: {e}")
+        logger.error("Redshift connection test failed: %s", e)
         request.session['rs_conn_status'] = 'need'
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'message': f'연결 오류: {str(e)}'
         })
@@ -152,21 +325,11 @@ def test_redshift_connection(request):
 @login_required
 def connect_all_databases(request):
     """Oracle과 Redshift 동시 연결"""
-    oracle_params = {
-        'host': request.POST.get('oracle_host', '').strip(),
-        'port': request.POST.get('oracle_port', '').strip(),
-        'service_name': request.POST.get('oracle_service_name', '').strip(),
-        'username': request.POST.get('oracle_username', '').strip(),
-        'password': request.POST.get('oracle_password', '').strip(),
-    }
+    if _conn_request_too_large(request):
+        return _conn_request_rejected()
     
-    redshift_params = {
-        'host': request.POST.get('redshift_host', '').strip(),
-        'port': request.POST.get('redshift_port', '').strip(),
-        'dbname': request.POST.get('redshift_dbname', '').strip(),
-        'username': request.POST.get('redshift_username', '').strip(),
-        'password': request.POST.get('redshift_password', '').strip(),
-    }
+    oracle_params = _extract_params(request.POST, ORACLE_CONN_FIELDS, prefix='oracle_')
+    redshift_params = _extract_params(request.POST, REDSHIFT_CONN_FIELDS, prefix='redshift_')
     
     result = {
         'success': False,
@@ -174,9 +337,13 @@ def connect_all_databases(request):
         'redshift_status': 'fail'
     }
     
-    # Oracle 연결 시도
-    if all(oracle_params.values()):
-        try:
+    # 두 연결 테스트는 서로 독립적이므로 동시에 수행
+    # (세션 기록은 요청 스레드에서만 처리)
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='conn-test') as pool:
+        oracle_future = None
+        redshift_future = None
+        
+        if all(oracle_params.values()):
             oracle_conn_details = {
                 'jdbc_url': OracleConnection.build_jdbc_url(
                     oracle_params['host'],
@@ -186,39 +353,44 @@ def connect_all_databases(request):
                 'username': oracle_params['username'],
                 'password': oracle_params['password']
             }
-            
-            oracle_conn = OracleConnection(**oracle_conn_details)
-            
-            if oracle_conn.test_connection():
-                request.session['db_conn_status'] = 'ok'
-                request.session['db_conn'] = oracle_conn_details
-                result['oracle_status'] = 'ok'
-                logger.info("Oracle connected successfully")
-            else:
-                result['oracle_error'] = 'Connection test failed'
-                
-        except Exception as e:
-            result['oracle_error'] = str(e)
-            request.session['db_conn_status'] = 'need'
-            logger.error(f"Oracle connection error: {e}")
-    
-    # Redshift 연결 시도
-    if all(redshift_params.values()):
-        try:
-            redshift_conn = RedshiftConnection(**redshift_params)
-            
-            if redshift_conn.test_connection():
-                request.session['rs_conn_status'] = 'ok'
-                request.session['rs_conn'] = redshift_params
-                result['redshift_status'] = 'ok'
-                logger.info("Redshift connected successfully")
-            else:
-                result['redshift_error'] = 'Connection test failed'
-                
-        except Exception as e:
-            result['redshift_error'] = str(e)
-            request.session['rs_conn_status'] = 'need'
-            logger.error(f"Redshift connection error: {e}")
+            oracle_future = pool.submit(
+                OracleConnection(**oracle_conn_details).test_connection
+            )
+        
+        if all(redshift_params.values()):
+            redshift_future = pool.submit(
+                RedshiftConnection(**redshift_params).test_connection
+            )
+        
+        # Oracle 연결 결과
+        if oracle_future is not None:
+            try:
+                if oracle_future.result():
+                    _mark_verified(request, 'db_conn', oracle_conn_details)
+                    result['oracle_status'] = 'ok'
+                    logger.info("Oracle connected successfully")
+                else:
+                    result['oracle_error'] = 'Connection test failed'
+                    
+            except Exception as e:
+                result['oracle_error'] = str(e)
+                request.session['db_conn_status'] = 'need'
+                logger.error("Oracle connection error: %s", e)
+        
+        # Redshift 연결 결과
+        if redshift_future is not None:
+            try:
+                if redshift_future.result():
+                    _mark_verified(request, 'rs_conn', redshift_params)
+                    result['redshift_status'] = 'ok'
+                    logger.info("Redshift connected successfully")
+                else:
+                    result['redshift_error'] = 'Connection test failed'
+                    
+            except Exception as e:
+                result['redshift_error'] = str(e)
+                request.session['rs_conn_status'] = 'need'
+                logger.error("Redshift connection error: %s", e)
     
     # 전체 성공 여부
     result['success'] = (
@@ -226,7 +398,7 @@ def connect_all_databases(request):
         result['redshift_status'] == 'ok'
     )
     
-    return JsonResponse(result)
+    return ORJsonResponse(result)
 
 
 # ==================== 통합 데이터 조회 API ====================
@@ -240,132 +412,258 @@ def query_all_integrated(request):
     alert_id = request.POST.get('alert_id', '').strip()
     
     if not alert_id:
-        return JsonResponse({
+        return ORJsonResponse({
             'success': False,
             'message': 'ALERT ID를 입력하세요.'
         })
     
-    # Oracle 연결 확인
-    db_info = request.session.get('db_conn')
-    if not db_info or request.session.get('db_conn_status') != 'ok':
-        return JsonResponse({
+    session = request.session
+    db_ok = session.get('db_conn_status') == 'ok'
+    rs_ok = session.get('rs_conn_status') == 'ok'
+    
+    # Oracle 연결 확인 (접속 정보는 캐시에 보관, 만료 시 재연결 필요)
+    db_info = load_session_data(request, 'db_conn') if db_ok else None
+    if not db_info:
+        session['db_conn_status'] = 'need'
+        clear_session_data(request, 'db_conn')
+        return ORJsonResponse({
             'success': False,
             'message': 'Oracle 데이터베이스 연결이 필요합니다.'
         })
     
     # Redshift 연결 확인 (옵션)
-    rs_info = None
-    if request.session.get('rs_conn_status') == 'ok':
-        rs_info = request.session.get('rs_conn')
+    rs_info = load_session_data(request, 'rs_conn') if rs_ok else None
+    if rs_ok and not rs_info:
+        session['rs_conn_status'] = 'need'
+        clear_session_data(request, 'rs_conn')
+    
+    # 같은 DB에서 같은 ALERT ID를 바로 다시 조회한 경우(중복 클릭 등) 직전 결과 재사용
+    conn_scope = _connection_scope(db_info, rs_info)
+    recent = _recent_integrated_result(request, alert_id, conn_scope)
+    if recent is not None:
+        logger.info("Reusing recent integrated query result for ALERT ID: %s", alert_id)
+        return ORJsonResponse(recent)
     
     try:
-        logger.info(f"Starting integrated query for ALERT ID: {alert_id}")
+        logger.info("Starting integrated query for ALERT ID: %s", alert_id)
         
-        # QueryManager를 통해 모든 Stage 실행
-        query_manager = QueryManager(db_info, rs_info)
-        result = query_manager.execute_all_queries(alert_id)
+        # QueryManager를 통해 모든 Stage 실행 (동일 요청 동시 실행 방지)
+        result = _execute_integrated_query(
+            (request.user.pk, conn_scope, alert_id), db_info, rs_info, alert_id
+        )
         
         if not result['success']:
-            return JsonResponse(result)
+            return ORJsonResponse(result)
         
-        # 세션에 결과 저장
-        request.session['df_manager_data'] = result['df_manager_data']
-        request.session['last_alert_id'] = alert_id
+        # 조회 결과는 캐시에 저장하고 세션에는 키만 보관
+        store_session_data(request, 'df_manager_data', result['df_manager_data'], compress=True)
+        session['last_alert_id'] = alert_id
+        session['last_alert_scope'] = conn_scope
+        session['last_alert_queried_at'] = time.time()
         
         # 요약 정보 생성
         summary = result.get('summary', {})
-        dataset_count = result.get('dataset_count', 0)
         
-        return JsonResponse({
-            'success': True,
-            'alert_id': alert_id,
-            'dataset_count': dataset_count,
-            'summary': summary,
-            'message': f"데이터 조회 완료: {dataset_count}개 데이터셋"
-        })
+        # 상태 조회용 요약은 별도 보관 (상태 조회 시 DataFrame 복원 불필요)
+        store_session_data(request, 'df_manager_meta', _build_df_manager_status(
+            summary,
+            list(result['df_manager_data'].get('datasets', {}).keys()),
+            alert_id
+        ))
+        
+        return ORJsonResponse(_build_integrated_response(
+            alert_id, summary, result.get('dataset_count', 0)
+        ))
         
     except Exception as e:
-        logger.exception(f"Error in integrated query: {e}")
-        return JsonResponse({
+        logger.exception("Error in integrated query: %s", e)
+        return ORJsonResponse({
             'success': False,
             'message': f'통합 조회 중 오류 발생: {str(e)}'
         })
 
 
+def _build_integrated_response(alert_id: str, summary: dict, dataset_count: int) -> dict:
+    """query_all_integrated 성공 응답 본문 구성"""
+    return {
+        'success': True,
+        'alert_id': alert_id,
+        'dataset_count': dataset_count,
+        'summary': summary,
+        'message': f"데이터 조회 완료: {dataset_count}개 데이터셋"
+    }
+
+
+def _connection_scope(db_info: dict, rs_info) -> str:
+    """조회 대상 DB 식별 해시 (Oracle 및 Redshift 접속 대상/사용자, 비밀번호 제외)"""
+    scope = OracleConnection.from_session(db_info).identity
+    if rs_info:
+        scope = f"{scope}|{RedshiftConnection.from_session(rs_info).identity}"
+    return hashlib.sha1(scope.encode('utf-8')).hexdigest()
+
+
+def _recent_integrated_result(request, alert_id: str, conn_scope: str):
+    """
+    같은 DB(conn_scope)에서 같은 ALERT ID를 최근(REPEAT_QUERY_REUSE_SECONDS 이내)에 조회했고
+    결과가 유효하면 저장된 요약으로 응답 본문 구성 (없으면 None)
+    """
+    session = request.session
+    if session.get('last_alert_id') != alert_id:
+        return None
+    if session.get('last_alert_scope') != conn_scope:
+        return None
+    if time.time() - session.get('last_alert_queried_at', 0) >= REPEAT_QUERY_REUSE_SECONDS:
+        return None
+    
+    cache_key = get_session_data_key(request, 'df_manager_data')
+    if not cache_key or not has_session_data(request, 'df_manager_data'):
+        return None
+    
+    status = load_session_data(request, 'df_manager_meta')
+    if not status:
+        return None
+    
+    summary = status['summary']
+    return _build_integrated_response(alert_id, summary, len(summary.get('datasets', {})))
+
+
+# (사용자 ID, 조회 대상 DB 식별 해시, ALERT ID) → 진행 중인 통합 조회 결과
+_inflight_queries = {}
+_inflight_queries_lock = threading.Lock()
+
+
+def _execute_integrated_query(request_key: tuple, db_info: dict,
+                              rs_info, alert_id: str) -> dict:
+    """
+    통합 조회 실행
+    같은 사용자가 같은 DB에서 같은 ALERT ID를 동시에 조회하면(중복 클릭, 여러 탭) 먼저 시작한 조회 결과를 공유
+    """
+    with _inflight_queries_lock:
+        future = _inflight_queries.get(request_key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_queries[request_key] = future
+    
+    if not is_owner:
+        logger.info("Waiting for in-flight integrated query: %s", alert_id)
+        return future.result(timeout=INFLIGHT_QUERY_TIMEOUT)
+    
+    try:
+        result = QueryManager(db_info, rs_info).execute_all_queries(alert_id)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_queries_lock:
+            _inflight_queries.pop(request_key, None)
+
+
 # ==================== DataFrame 관리 API ====================
 
+def _build_df_manager_status(summary: dict, datasets_list: list, alert_id) -> dict:
+    """df_manager_status 응답 본문 구성"""
+    return {
+        'summary': summary,
+        'datasets_list': datasets_list,
+        'alert_id': alert_id,
+        'total_memory_mb': summary.get('total_memory_mb', 0)
+    }
+
+
 @login_required
 def df_manager_status(request):
     """DataFrame Manager 상태 조회"""
-    df_manager_data = request.session.get('df_manager_data')
+    # 조회 결과마다 새 캐시 키가 발급되므로 키 자체를 ETag로 사용
+    cache_key = get_session_data_key(request, 'df_manager_data')
+    etag = f'"{cache_key.rsplit(":", 1)[-1]}"' if cache_key else None
     
-    if not df_manager_data:
-        return JsonResponse({
-            'success': False,
-            'message': '조회된 데이터가 없습니다.'
-        })
+    if etag and request.headers.get('If-None-Match') == etag and has_session_data(request, 'df_manager_data'):
+        response = HttpResponse(status=304)
+        response['ETag'] = etag
+        return response
     
     try:
-        df_manager = DataFrameManager.from_dict(df_manager_data)
-        summary = df_manager.get_all_datasets_summary()
+        # 조회 시점에 저장한 요약 정보 사용 (원본 데이터가 유효한 경우에만)
+        status = None
+        if cache_key and has_session_data(request, 'df_manager_data'):
+            status = load_session_data(request, 'df_manager_meta')
         
-        return JsonResponse({
-            'success': True,
-            'summary': summary,
-            'datasets_list': list(df_manager.datasets.keys()),
-            'alert_id': df_manager.alert_id,
-            'total_memory_mb': summary.get('total_memory_mb', 0)
-        })
+        if status is None:
+            df_manager = _load_df_manager(request)
+            
+            if df_manager is None:
+                return ORJsonResponse({
+                    'success': False,
+                    'message': '조회된 데이터가 없습니다.'
+                })
+            
+            status = _build_df_manager_status(
+                df_manager.get_all_datasets_summary(),
+                list(df_manager.datasets.keys()),
+                df_manager.alert_id
+            )
+        
+        response = ORJsonResponse({'success': True, **status})
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
         
     except Exception as e:
-        logger.error(f"Error getting DF manager status: {e}")
-        return JsonResponse({
+        logger.error("Error getting DF manager status: %s", e)
+        return ORJsonResponse({
             'success': False,
             'message': str(e)
         })
 
 
+def _iter_csv(df):
+    """
+    DataFrame을 CSV 바이트로 나누어 생성 (전체 CSV 문자열을 메모리에 만들지 않음)
+    Excel 호환을 위해 BOM은 첫 청크에만 한 번 출력
+    """
+    yield codecs.BOM_UTF8
+    for start in range(0, max(len(df), 1), CSV_CHUNK_ROWS):
+        chunk = df.iloc[start:start + CSV_CHUNK_ROWS]
+        yield chunk.to_csv(index=False, header=(start == 0)).encode('utf-8')
+
+
 @login_required
 def export_dataframe_csv(request):
     """DataFrame을 CSV로 내보내기"""
-    import io
-    
     dataset_name = request.GET.get('dataset', '').strip()
     
     if not dataset_name:
         return HttpResponse('Dataset name is required', status=400)
     
-    df_manager_data = request.session.get('df_manager_data')
-    
-    if not df_manager_data:
-        return HttpResponse('No data found in session', status=404)
-    
     try:
-        df_manager = DataFrameManager.from_dict(df_manager_data)
+        df_manager = _load_df_manager(request)
+        
+        if df_manager is None:
+            return HttpResponse('No data found in session', status=404)
+        
         df = df_manager.get_dataframe(dataset_name)
         
         if df is None:
             return HttpResponse(f'Dataset "{dataset_name}" not found', status=404)
         
-        # CSV 생성
-        output = io.StringIO()
-        df.to_csv(output, index=False, encoding='utf-8-sig')
-        
         # 파일명 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{dataset_name}_{timestamp}.csv"
         
-        # 응답 생성
-        response = HttpResponse(
-            output.getvalue(),
+        # 응답 생성 (청크 단위 스트리밍)
+        response = StreamingHttpResponse(
+            _iter_csv(df),
             content_type='text/csv; charset=utf-8-sig'
         )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response['Content-Disposition'] = content_disposition_header(True, filename)
         
         return response
         
     except Exception as e:
-        logger.error(f"Error exporting CSV: {e}")
+        logger.error("Error exporting CSV: %s", e)
         return HttpResponse(f'Export error: {str(e)}', status=500)
 
 
@@ -375,45 +673,47 @@ def export_dataframe_csv(request):
 @login_required
 def prepare_toml_data(request):
     """TOML 데이터 준비"""
-    df_manager_data = request.session.get('df_manager_data')
+    # 상태 조회/CSV 내보내기와 같은 복원 결과 재사용
+    df_manager = _load_df_manager(request)
     
-    if not df_manager_data:
-        return JsonResponse({
+    if df_manager is None:
+        return ORJsonResponse({
             'success': False,
             'message': 'TOML로 내보낼 데이터가 없습니다.'
         })
     
     try:
-        # 파일명 생성
-        alert_id = df_manager_data.get('alert_id', 'unknown')
-        filename = toml_exporter.generate_filename(alert_id)
-        
-        # 임시 파일 경로 생성
-        tmp_path = Path(tempfile.gettempdir()) / filename
-        request.session['toml_temp_path'] = str(tmp_path)
-        
-        # TOML 데이터 수집 및 저장
-        collected_data = toml_collector.collect_all_data(df_manager_data)
-        success = toml_exporter.save_to_file(collected_data, str(tmp_path))
-        
-        if not success:
-            return JsonResponse({
-                'success': False,
-                'message': 'TOML 파일 생성 실패'
-            })
-        
-        logger.info(f"TOML data prepared: {filename}")
+        # 같은 조회 결과로 이미 생성된 TOML이 있으면 재생성하지 않음
+        source_key = get_session_data_key(request, 'df_manager_data')
+        toml_export = load_session_data(request, 'toml_export')
+        
+        if not toml_export or toml_export.get('source_key') != source_key:
+            # 파일명 생성
+            alert_id = df_manager.alert_id or 'unknown'
+            filename = toml_exporter.generate_filename(alert_id)
+            
+            # TOML 데이터 수집 및 생성 (임시 파일 대신 캐시에 보관)
+            collected_data = toml_collector.collect_all_data(df_manager)
+            toml_export = {
+                'filename': filename,
+                'content': toml_exporter.to_bytes(collected_data),
+                'sections': list(collected_data.keys()),
+                'source_key': source_key
+            }
+            store_session_data(request, 'toml_export', toml_export)
+            
+            logger.info("TOML data prepared: %s", toml_export['filename'])
         
-        return JsonResponse({
+        return ORJsonResponse({
             'success': True,
             'message': 'TOML 데이터 준비 완료',
-            'filename': filename,
-            'sections': list(collected_data.keys())
+            'filename': toml_export['filename'],
+            'sections': toml_export['sections']
         })
         
     except Exception as e:
-        logger.exception(f"Error preparing TOML data: {e}")
-        return JsonResponse({
+        logger.exception("Error preparing TOML data: %s", e)
+        return ORJsonResponse({
             'success': False,
             'message': f'TOML 데이터 준비 실패: {str(e)}'
         })
@@ -422,47 +722,30 @@ def prepare_toml_data(request):
 @login_required
 def download_toml(request):
     """TOML 파일 다운로드"""
-    tmp_path_str = request.session.get('toml_temp_path')
+    toml_export = load_session_data(request, 'toml_export')
     
-    if not tmp_path_str:
-        return HttpResponse(
-            'TOML 파일 경로를 찾을 수 없습니다.',
-            status=400
-        )
-    
-    tmp_path = Path(tmp_path_str)
-    
-    if not tmp_path.exists():
+    if not toml_export:
         return HttpResponse(
             'TOML 파일을 찾을 수 없습니다. 다시 생성해주세요.',
             status=404
         )
     
     try:
-        # 파일 응답 생성
-        response = FileResponse(
-            open(tmp_path, 'rb'),
-            as_attachment=True,
-            filename=tmp_path.name
-        )
+        filename = toml_export['filename']
         
-        logger.info(f"TOML file downloaded: {tmp_path.name}")
-        
-        # 다운로드 후 임시 파일 삭제
-        def cleanup():
-            try:
-                tmp_path.unlink()
-                logger.info(f"Temporary TOML file deleted: {tmp_path}")
-            except Exception as e:
-                logger.warning(f"Could not delete temp file: {e}")
+        response = HttpResponse(
+            toml_export['content'],
+            content_type='application/toml; charset=utf-8'
+        )
+        response['Content-Disposition'] = content_disposition_header(True, filename)
         
-        # 응답 전송 후 정리
-        response.close_callback = cleanup
+        # 보관 데이터는 재다운로드를 위해 유지 (다음 조회 결과로 준비 시 교체, 캐시 만료 시 삭제)
+        logger.info("TOML file downloaded: %s", filename)
         
         return response
         
     except Exception as e:
-        logger.exception(f"Error downloading TOML: {e}")
+        logger.exception("Error downloading TOML: %s", e)
         return HttpResponse(
             f'TOML 다운로드 실패: {str(e)}',
             status=500
@@ -476,31 +759,43 @@ def download_toml(request):
 def save_to_session(request):
     """범용 세션 저장 API"""
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         key = data.get('key')
         value = data.get('value')
         
         if not key:
-            return JsonResponse({
+            return ORJsonResponse({
                 'success': False,
                 'message': 'Key is required'
             })
         
-        request.session[key] = value
+        # 화면 상태 값은 크기가 클 수 있으므로 캐시에 보관하고 세션에는 키만 기록
+        # (내부 세션 항목과 충돌하지 않도록 별도 접두어 사용)
+        slot = f'{UI_STATE_SLOT_PREFIX}{key}'
+        
+        # 같은 값 재저장 요청은 캐시/세션 쓰기 생략
+        if value is not None and load_session_data(request, slot) == value:
+            return ORJsonResponse({
+                'success': True,
+                'noop': True,
+                'message': f'Already saved with key: {key}'
+            })
+        
+        store_session_data(request, slot, value)
         
-        return JsonResponse({
+        return ORJsonResponse({
             'success': True,
             'message': f'Saved to session with key: {key}'
         })
         
-    except json.JSONDecodeError:
-        return JsonResponse({
+    except orjson.JSONDecodeError:
+        return ORJsonResponse({
             'success': False,
             'message': 'Invalid JSON data'
         })
     except Exception as e:
-        logger.error(f"Error saving to session: {e}")
-        return JsonResponse({
+        logger.error("Error saving to session: %s", e)
+        return ORJsonResponse({
             'success': False,
             'message': str(e)
         })
\ No newline at end of file